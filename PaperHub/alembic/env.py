@@ -0,0 +1,72 @@
+"""
+Alembic 迁移环境
+复用 app.database 中的连接配置和 ORM 元数据
+"""
+from logging.config import fileConfig
+import os
+
+from alembic import context
+
+from app.database import Base, engine, DATABASE_URL
+import app.models  # noqa: F401  注册所有模型到 Base.metadata
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# 建索引时的会话参数（可选）：HNSW 图超出 maintenance_work_mem 后会溢出到磁盘，百万行量级构建从数分钟变成数小时，
+# ~1M × 384 维 halfvec 建议 2GB / 7。未设置时沿用服务器配置：并行构建按 maintenance_work_mem 申请共享内存，
+# Docker 默认 /dev/shm 只有 64MB，调高前需先增大容器的 shm_size
+INDEX_BUILD_WORK_MEM = os.getenv("INDEX_BUILD_WORK_MEM")
+INDEX_BUILD_PARALLEL_WORKERS = os.getenv("INDEX_BUILD_PARALLEL_WORKERS")
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """autogenerate 忽略向量索引：其类型和参数由迁移按环境变量与数据量决定，模型中不声明"""
+    if type_ == "index" and name and name.startswith("ix_papers_embedding_"):
+        return False
+    return True
+
+
+def set_index_build_params():
+    """SET LOCAL 只在本次迁移事务内生效，覆盖其中所有 CREATE INDEX；只应用显式设置的参数"""
+    if INDEX_BUILD_WORK_MEM:
+        context.execute(f"SET LOCAL maintenance_work_mem = '{INDEX_BUILD_WORK_MEM}'")
+    if INDEX_BUILD_PARALLEL_WORKERS:
+        context.execute(f"SET LOCAL max_parallel_maintenance_workers = {int(INDEX_BUILD_PARALLEL_WORKERS)}")
+
+
+def run_migrations_offline():
+    """离线模式：只生成 SQL 脚本，不连接数据库"""
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        set_index_build_params()
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """在线模式：直接对数据库执行迁移"""
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
+        with context.begin_transaction():
+            set_index_build_params()
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,78 @@
+"""baseline schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    op.create_table(
+        'papers',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('title', sa.String(500), nullable=False),
+        sa.Column('authors', sa.JSON(), nullable=False),
+        sa.Column('abstract', sa.Text(), nullable=True),
+        sa.Column('pdf_url', sa.String(500), nullable=True),
+        sa.Column('arxiv_id', sa.String(50), nullable=True),
+        sa.Column('category', sa.String(100), nullable=True),
+        sa.Column('published_date', sa.DateTime(), nullable=True),
+        sa.Column('embedding', Vector(384), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_papers_id', 'papers', ['id'])
+    op.create_index('ix_papers_title', 'papers', ['title'])
+    op.create_index('ix_papers_arxiv_id', 'papers', ['arxiv_id'], unique=True)
+    op.create_index('ix_papers_category', 'papers', ['category'])
+    op.create_index('ix_papers_published_date', 'papers', ['published_date'])
+
+    op.create_table(
+        'tags',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('description', sa.String(500), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_tags_id', 'tags', ['id'])
+    op.create_index('ix_tags_name', 'tags', ['name'], unique=True)
+
+    op.create_table(
+        'paper_tags',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('paper_id', sa.Integer(), sa.ForeignKey('papers.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('tag_id', sa.Integer(), sa.ForeignKey('tags.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_paper_tags_id', 'paper_tags', ['id'])
+    op.create_index('ix_paper_tag_unique', 'paper_tags', ['paper_id', 'tag_id'], unique=True)
+
+    op.create_table(
+        'reading_histories',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('paper_id', sa.Integer(), sa.ForeignKey('papers.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('user_id', sa.String(100), nullable=False),
+        sa.Column('read_at', sa.DateTime(), nullable=False),
+        sa.Column('rating', sa.Integer(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+    )
+    op.create_index('ix_reading_histories_id', 'reading_histories', ['id'])
+    op.create_index('ix_reading_histories_user_id', 'reading_histories', ['user_id'])
+    op.create_index('ix_reading_histories_read_at', 'reading_histories', ['read_at'])
+
+
+def downgrade():
+    op.drop_table('reading_histories')
+    op.drop_table('paper_tags')
+    op.drop_table('tags')
+    op.drop_table('papers')
@@ -0,0 +1,34 @@
+"""paper full-text search vector and trigram index
+
+为 papers 表添加 tsvector 生成列 search_vec 及其 GIN 索引，
+并为 title 建立 pg_trgm 三元组 GIN 索引，支持子串匹配走索引。
+语句均带 IF NOT EXISTS，可在由 init_db() 建表的库上直接执行。
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("""
+        ALTER TABLE papers ADD COLUMN IF NOT EXISTS search_vec tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('english', coalesce(title, '') || ' ' || coalesce(abstract, ''))
+        ) STORED
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_papers_search_gin ON papers USING gin (search_vec)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_papers_title_trgm ON papers USING gin (title gin_trgm_ops)")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_papers_title_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_papers_search_gin")
+    op.execute("ALTER TABLE papers DROP COLUMN IF EXISTS search_vec")
@@ -0,0 +1,53 @@
+"""tag name trigram and case-insensitive unique indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+# 每个标签对应的保留标签：大小写不同的同名标签中 id 最小的一个
+_TAG_KEEP = "(SELECT id, min(id) OVER (PARTITION BY lower(name)) AS keep FROM tags)"
+
+
+def _merge_case_duplicate_tags():
+    """合并仅大小写不同的标签（如 NLP / nlp），否则下面的唯一索引无法建立"""
+    # 同一论文在合并后会重复的关联只保留一条（优先保留已指向保留标签的那条）
+    op.execute(f"""
+        DELETE FROM paper_tags WHERE id IN (
+            SELECT id FROM (
+                SELECT pt.id, row_number() OVER (
+                    PARTITION BY pt.paper_id, d.keep ORDER BY (pt.tag_id = d.keep) DESC, pt.id
+                ) AS rn
+                FROM paper_tags pt JOIN {_TAG_KEEP} d ON d.id = pt.tag_id
+            ) ranked WHERE rn > 1
+        )
+    """)
+    # 其余关联改指向保留标签，再删除多余标签
+    op.execute(f"""
+        UPDATE paper_tags pt SET tag_id = d.keep
+        FROM {_TAG_KEEP} d
+        WHERE pt.tag_id = d.id AND d.id <> d.keep
+    """)
+    op.execute(f"""
+        DELETE FROM tags t USING {_TAG_KEEP} d
+        WHERE t.id = d.id AND d.id <> d.keep
+    """)
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    _merge_case_duplicate_tags()
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_tags_name_lower ON tags (lower(name))")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_tags_name_trgm ON tags USING gin (name gin_trgm_ops)")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_tags_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_tags_name_lower")
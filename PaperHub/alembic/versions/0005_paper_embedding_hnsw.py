@@ -0,0 +1,23 @@
+"""paper embedding HNSW index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_papers_embedding_hnsw "
+        "ON papers USING hnsw (embedding vector_cosine_ops)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_papers_embedding_hnsw")
@@ -0,0 +1,23 @@
+"""paper (published_date, id) index for keyset pagination
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_papers_published_date_id "
+        "ON papers (published_date, id)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_papers_published_date_id")
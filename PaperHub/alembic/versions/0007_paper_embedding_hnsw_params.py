@@ -0,0 +1,35 @@
+"""rebuild paper embedding HNSW index with explicit build parameters
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15
+"""
+import os
+
+from alembic import op
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+# 索引构建参数：大库重建索引前可通过环境变量调大（召回更高，构建更慢、索引更大）
+HNSW_M = int(os.getenv("HNSW_M", "16"))
+HNSW_EF_CONSTRUCTION = int(os.getenv("HNSW_EF_CONSTRUCTION", "64"))
+
+
+def upgrade():
+    op.execute("DROP INDEX IF EXISTS ix_papers_embedding_hnsw")
+    op.execute(
+        "CREATE INDEX ix_papers_embedding_hnsw "
+        "ON papers USING hnsw (embedding vector_cosine_ops) "
+        f"WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_papers_embedding_hnsw")
+    op.execute(
+        "CREATE INDEX ix_papers_embedding_hnsw "
+        "ON papers USING hnsw (embedding vector_cosine_ops)"
+    )
@@ -0,0 +1,44 @@
+"""store paper embeddings as halfvec(384)
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15
+"""
+import os
+
+from alembic import op
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+# halfvec 需要 pgvector 扩展 0.7 及以上版本
+HNSW_M = int(os.getenv("HNSW_M", "16"))
+HNSW_EF_CONSTRUCTION = int(os.getenv("HNSW_EF_CONSTRUCTION", "64"))
+
+
+def _create_hnsw_index(opclass):
+    op.execute(
+        "CREATE INDEX ix_papers_embedding_hnsw "
+        f"ON papers USING hnsw (embedding {opclass}) "
+        f"WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})"
+    )
+
+
+def upgrade():
+    op.execute("DROP INDEX IF EXISTS ix_papers_embedding_hnsw")
+    op.execute(
+        "ALTER TABLE papers ALTER COLUMN embedding TYPE halfvec(384) "
+        "USING embedding::halfvec(384)"
+    )
+    _create_hnsw_index("halfvec_cosine_ops")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_papers_embedding_hnsw")
+    op.execute(
+        "ALTER TABLE papers ALTER COLUMN embedding TYPE vector(384) "
+        "USING embedding::vector(384)"
+    )
+    _create_hnsw_index("vector_cosine_ops")
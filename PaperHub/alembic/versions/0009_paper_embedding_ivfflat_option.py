@@ -0,0 +1,56 @@
+"""optional IVFFlat index for paper embeddings (VECTOR_INDEX_TYPE=ivfflat)
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-15
+"""
+import math
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+# 默认保持 HNSW；大批量静态数据首次导入时可设为 ivfflat，索引构建快一个数量级
+VECTOR_INDEX_TYPE = os.getenv("VECTOR_INDEX_TYPE", "hnsw").lower()
+HNSW_M = int(os.getenv("HNSW_M", "16"))
+HNSW_EF_CONSTRUCTION = int(os.getenv("HNSW_EF_CONSTRUCTION", "64"))
+
+
+def _embedded_rows():
+    """已有 embedding 的论文数（精确计数；reltuples 在新表或未 ANALYZE 时不可用）"""
+    return op.get_bind().execute(
+        sa.text("SELECT count(*) FROM papers WHERE embedding IS NOT NULL")
+    ).scalar()
+
+
+def upgrade():
+    if VECTOR_INDEX_TYPE != "ivfflat":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_papers_embedding_hnsw")
+    # IVFFlat 的聚类中心在建索引时由现有数据决定，空表上只能得到 lists = 1 的无效索引；
+    # 此时跳过，导入数据后用 python -m app.database rebuild-ivfflat 建立
+    rows = _embedded_rows()
+    if not rows:
+        print("papers 表中还没有 embedding，跳过 IVFFlat 索引；导入数据后运行 python -m app.database rebuild-ivfflat")
+        return
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_papers_embedding_ivfflat "
+        "ON papers USING ivfflat (embedding halfvec_cosine_ops) "
+        f"WITH (lists = {math.ceil(math.sqrt(rows))})"
+    )
+
+
+def downgrade():
+    if VECTOR_INDEX_TYPE != "ivfflat":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_papers_embedding_ivfflat")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_papers_embedding_hnsw "
+        "ON papers USING hnsw (embedding halfvec_cosine_ops) "
+        f"WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})"
+    )
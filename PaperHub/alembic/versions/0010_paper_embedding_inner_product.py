@@ -0,0 +1,59 @@
+"""normalize stored embeddings and index them for inner-product search
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-15
+"""
+import math
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+VECTOR_INDEX_TYPE = os.getenv("VECTOR_INDEX_TYPE", "hnsw").lower()
+HNSW_M = int(os.getenv("HNSW_M", "16"))
+HNSW_EF_CONSTRUCTION = int(os.getenv("HNSW_EF_CONSTRUCTION", "64"))
+
+
+def _create_embedding_index(opclass):
+    if VECTOR_INDEX_TYPE == "ivfflat":
+        # lists = ceil(sqrt(N))，N 为已有 embedding 的论文数；空表上跳过（见 0009）
+        rows = op.get_bind().execute(
+            sa.text("SELECT count(*) FROM papers WHERE embedding IS NOT NULL")
+        ).scalar()
+        if not rows:
+            print("papers 表中还没有 embedding，跳过 IVFFlat 索引；导入数据后运行 python -m app.database rebuild-ivfflat")
+            return
+        op.execute(
+            "CREATE INDEX ix_papers_embedding_ivfflat "
+            f"ON papers USING ivfflat (embedding {opclass}) WITH (lists = {math.ceil(math.sqrt(rows))})"
+        )
+    else:
+        op.execute(
+            "CREATE INDEX ix_papers_embedding_hnsw "
+            f"ON papers USING hnsw (embedding {opclass}) "
+            f"WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})"
+        )
+
+
+def _drop_embedding_indexes():
+    op.execute("DROP INDEX IF EXISTS ix_papers_embedding_hnsw")
+    op.execute("DROP INDEX IF EXISTS ix_papers_embedding_ivfflat")
+
+
+def upgrade():
+    _drop_embedding_indexes()
+    # 早期写入的 embedding 未归一化；单位向量上内积即余弦相似度
+    op.execute("UPDATE papers SET embedding = l2_normalize(embedding) WHERE embedding IS NOT NULL")
+    _create_embedding_index("halfvec_ip_ops")
+
+
+def downgrade():
+    # 归一化后的向量在余弦距离下结果不变，无需还原
+    _drop_embedding_indexes()
+    _create_embedding_index("halfvec_cosine_ops")
@@ -0,0 +1,28 @@
+"""reading history (user_id, read_at DESC) INCLUDE (paper_id) index
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_reading_histories_user_read_at "
+        "ON reading_histories (user_id, read_at DESC) INCLUDE (paper_id)"
+    )
+    # 单列索引被 (user_id, ...) 复合索引覆盖，read_at 单独过滤的查询不存在
+    op.execute("DROP INDEX IF EXISTS ix_reading_histories_user_id")
+    op.execute("DROP INDEX IF EXISTS ix_reading_histories_read_at")
+
+
+def downgrade():
+    op.execute("CREATE INDEX IF NOT EXISTS ix_reading_histories_read_at ON reading_histories (read_at)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_reading_histories_user_id ON reading_histories (user_id)")
+    op.execute("DROP INDEX IF EXISTS ix_reading_histories_user_read_at")
@@ -1,20 +1,60 @@
 """
 CRUD (Create, Read, Update, Delete) operations for database models
 """
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_, desc, func
-from typing import List, Optional
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only, raiseload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import or_, and_, delete, desc, func, insert, select, text, tuple_, update
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from typing import Dict, List, Optional, Set, Tuple, Union
 from datetime import datetime
+import os
+import threading
 import numpy as np
 
 from app.models import Paper, Tag, PaperTag, ReadingHistory
 from app.schemas import PaperCreate, PaperUpdate, TagCreate, ReadingHistoryCreate
 
 
+# 短于该长度的搜索词不使用全文检索
+MIN_FULLTEXT_QUERY_LENGTH = 3
+
+# 开发时设置 SQLALCHEMY_RAISELOAD=1：列表查询中未预加载的关系一旦被访问就报错，用于发现 N+1
+RAISELOAD_UNLOADED = os.getenv("SQLALCHEMY_RAISELOAD") == "1"
+
+# 统计结果缓存：60 秒过期，论文/标签增删改时清空
+_stat_cache = TTLCache(maxsize=8, ttl=60)
+_stat_lock = threading.RLock()
+
+
+# 列表类页面用到的论文列，其余列（embedding、时间戳等）访问时再按需加载
+LIST_COLUMNS = (
+    Paper.id, Paper.title, Paper.authors, Paper.abstract, Paper.pdf_url,
+    Paper.arxiv_id, Paper.category, Paper.published_date
+)
+
+
+def _invalidate_stats():
+    """清空统计缓存"""
+    with _stat_lock:
+        _stat_cache.clear()
+
+
 # ==================== Paper CRUD ====================
 
-def create_paper(db: Session, paper: PaperCreate, embedding: Optional[List[float]] = None) -> Paper:
-    """创建论文"""
+def _insert_paper_tags(db: Session, paper_id: int, tag_ids: List[int]) -> None:
+    """批量插入论文-标签关联（单条 INSERT 语句，不提交）"""
+    if tag_ids:
+        db.execute(insert(PaperTag), [{"paper_id": paper_id, "tag_id": tag_id} for tag_id in tag_ids])
+
+
+def create_paper(
+    db: Session,
+    paper: PaperCreate,
+    embedding: Optional[Union[np.ndarray, List[float]]] = None
+) -> Paper:
+    """创建论文（embedding 可直接传 np.ndarray，由 pgvector 负责编码）"""
     db_paper = Paper(
         title=paper.title,
         authors=paper.authors,
@@ -26,75 +66,271 @@ def create_paper(db: Session, paper: PaperCreate, embedding: Optional[List[float
         embedding=embedding
     )
     db.add(db_paper)
-    db.commit()
-    db.refresh(db_paper)
+    # flush 即可拿到自增主键，论文和标签关联在同一事务中提交
+    db.flush()
     
     # 添加标签关联
     if paper.tag_ids:
-        for tag_id in paper.tag_ids:
-            paper_tag = PaperTag(paper_id=db_paper.id, tag_id=tag_id)
-            db.add(paper_tag)
-        db.commit()
-        db.refresh(db_paper)
+        _insert_paper_tags(db, db_paper.id, paper.tag_ids)
+    db.commit()
     
+    _invalidate_stats()
     return db_paper
 
 
+def _paper_values(paper: PaperCreate, embedding=None) -> dict:
+    """PaperCreate 转为 INSERT 的列值"""
+    return {
+        "title": paper.title,
+        "authors": paper.authors,
+        "abstract": paper.abstract,
+        "pdf_url": paper.pdf_url,
+        "arxiv_id": paper.arxiv_id,
+        "category": paper.category,
+        "published_date": paper.published_date,
+        "embedding": embedding
+    }
+
+
+def upsert_paper_by_arxiv_id(
+    db: Session,
+    paper: PaperCreate,
+    embedding: Optional[Union[np.ndarray, List[float]]] = None
+) -> Optional[int]:
+    """
+    按 arXiv ID 导入论文：INSERT ... ON CONFLICT (arxiv_id) DO NOTHING
+    
+    Returns:
+        新论文 ID；arXiv ID 已存在时返回 None
+    """
+    stmt = pg_insert(Paper).values(**_paper_values(paper, embedding)).on_conflict_do_nothing(
+        index_elements=[Paper.arxiv_id]
+    ).returning(Paper.id)
+    paper_id = db.execute(stmt).scalar_one_or_none()
+    if paper_id is None:
+        # 冲突时什么也没写入；提交而不是回滚，保留调用方会话中其他未提交的修改
+        db.commit()
+        return None
+    
+    if paper.tag_ids:
+        _insert_paper_tags(db, paper_id, paper.tag_ids)
+    db.commit()
+    
+    _invalidate_stats()
+    return paper_id
+
+
+def create_papers(
+    db: Session,
+    papers: List[PaperCreate],
+    embeddings: Optional[Union[np.ndarray, List[List[float]]]] = None
+) -> Dict[str, int]:
+    """
+    批量导入论文：单条多行 INSERT ... ON CONFLICT (arxiv_id) DO NOTHING，
+    标签关联单条 INSERT，整批只提交一次
+    
+    Returns:
+        新插入论文的 {arxiv_id: id}，已存在的 arXiv ID 被跳过
+    """
+    if not papers:
+        return {}
+    if embeddings is None:
+        embeddings = [None] * len(papers)
+    stmt = pg_insert(Paper).values([
+        _paper_values(paper, embedding) for paper, embedding in zip(papers, embeddings)
+    ]).on_conflict_do_nothing(
+        index_elements=[Paper.arxiv_id]
+    ).returning(Paper.id, Paper.arxiv_id)
+    inserted = {arxiv_id: paper_id for paper_id, arxiv_id in db.execute(stmt).all()}
+    
+    rows = [
+        {"paper_id": inserted[paper.arxiv_id], "tag_id": tag_id}
+        for paper in papers if paper.arxiv_id in inserted
+        for tag_id in (paper.tag_ids or [])
+    ]
+    if rows:
+        db.execute(insert(PaperTag), rows)
+    db.commit()
+    
+    _invalidate_stats()
+    return inserted
+
+
+def _get_paper_bare(db: Session, paper_id: int) -> Optional[Paper]:
+    """按主键获取论文，不预加载标签（优先命中 identity map）"""
+    return db.get(Paper, paper_id)
+
+
 def get_paper(db: Session, paper_id: int) -> Optional[Paper]:
-    """获取单个论文"""
+    """获取单个论文（含标签，用于详情页）"""
     return db.query(Paper).options(
         joinedload(Paper.paper_tags).joinedload(PaperTag.tag)
     ).filter(Paper.id == paper_id).first()
 
 
+def get_papers_by_ids(db: Session, paper_ids: List[int]) -> List[Paper]:
+    """按 ID 批量获取论文（单条 IN 查询），结果保持 paper_ids 的顺序"""
+    if not paper_ids:
+        return []
+    papers = db.scalars(
+        select(Paper).options(load_only(*LIST_COLUMNS)).where(Paper.id.in_(paper_ids))
+    ).all()
+    papers_by_id = {paper.id: paper for paper in papers}
+    return [papers_by_id[pid] for pid in paper_ids if pid in papers_by_id]
+
+
 def get_paper_by_arxiv_id(db: Session, arxiv_id: str) -> Optional[Paper]:
     """通过 arXiv ID 获取论文"""
     return db.query(Paper).filter(Paper.arxiv_id == arxiv_id).first()
 
 
-def get_papers(
-    db: Session,
+def list_paper_titles(db: Session, query: Optional[str] = None, limit: int = 50) -> List[Tuple[int, str]]:
+    """获取 (id, 标题) 列表，只查询这两列，用于下拉选择框"""
+    stmt = select(Paper.id, Paper.title)
+    if query:
+        stmt = stmt.where(Paper.title.ilike(f"%{query}%"))
+    stmt = stmt.order_by(desc(Paper.published_date), desc(Paper.id)).limit(limit)
+    return [(paper_id, title) for paper_id, title in db.execute(stmt).all()]
+
+
+def get_recent_paper_titles(db: Session, limit: int = 10) -> List[Tuple[str, datetime]]:
+    """获取最近导入论文的 (标题, 导入时间)（自增主键与导入顺序一致，按主键倒序走索引）"""
+    stmt = select(Paper.title, Paper.created_at).order_by(desc(Paper.id)).limit(limit)
+    return [(title, created_at) for title, created_at in db.execute(stmt).all()]
+
+
+def existing_arxiv_ids(db: Session, arxiv_ids: List[str]) -> Set[str]:
+    """返回给定 arXiv ID 中已入库的部分（单条 IN 查询）"""
+    if not arxiv_ids:
+        return set()
+    return set(db.scalars(select(Paper.arxiv_id).where(Paper.arxiv_id.in_(arxiv_ids))).all())
+
+
+def _papers_statement(
     skip: int = 0,
     limit: int = 50,
     query: Optional[str] = None,
     category: Optional[str] = None,
     tag_ids: Optional[List[int]] = None,
     start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None
-) -> List[Paper]:
-    """获取论文列表（支持多条件筛选）"""
-    db_query = db.query(Paper).options(
-        joinedload(Paper.paper_tags).joinedload(PaperTag.tag)
+    end_date: Optional[datetime] = None,
+    cursor: Optional[Tuple[Optional[datetime], int]] = None
+):
+    """构建论文列表查询语句（同步 / 异步查询共用）"""
+    # selectinload 用一条 IN 查询加载标签，避免 JOIN 放大行数并破坏 LIMIT 语义
+    # 列表只加载展示用到的列，embedding 等大列不随列表传输
+    stmt = select(Paper).options(
+        load_only(*LIST_COLUMNS),
+        selectinload(Paper.paper_tags).selectinload(PaperTag.tag)
     )
+    if RAISELOAD_UNLOADED:
+        stmt = stmt.options(raiseload("*"))
+    
+    filters = []
     
     # 文本搜索（标题或摘要）
     if query:
-        search_filter = or_(
-            Paper.title.ilike(f"%{query}%"),
-            Paper.abstract.ilike(f"%{query}%")
-        )
-        db_query = db_query.filter(search_filter)
+        if len(query) >= MIN_FULLTEXT_QUERY_LENGTH:
+            # 全文检索走 search_vec 的 GIN 索引，标题子串匹配走 pg_trgm 索引
+            filters.append(or_(
+                Paper.search_vec.op('@@')(func.plainto_tsquery('english', query)),
+                Paper.title.ilike(f"%{query}%")
+            ))
+        else:
+            # 过短的查询无法有效分词，退回子串匹配
+            filters.append(or_(
+                Paper.title.ilike(f"%{query}%"),
+                Paper.abstract.ilike(f"%{query}%")
+            ))
     
     # 类别筛选
     if category:
-        db_query = db_query.filter(Paper.category == category)
+        filters.append(Paper.category == category)
     
     # 标签筛选
     if tag_ids:
-        db_query = db_query.join(PaperTag).filter(PaperTag.tag_id.in_(tag_ids))
+        filters.append(Paper.paper_tags.any(PaperTag.tag_id.in_(tag_ids)))
+    
+    # 日期范围筛选（两端都有时合并为一个 BETWEEN 区间条件）
+    if start_date and end_date:
+        filters.append(Paper.published_date.between(start_date, end_date))
+    elif start_date:
+        filters.append(Paper.published_date >= start_date)
+    elif end_date:
+        filters.append(Paper.published_date <= end_date)
+    
+    # keyset 分页（DESC 排序时 NULL 日期排在最前）
+    if cursor:
+        last_date, last_id = cursor
+        if last_date is None:
+            filters.append(or_(
+                and_(Paper.published_date.is_(None), Paper.id < last_id),
+                Paper.published_date.isnot(None)
+            ))
+        else:
+            filters.append(tuple_(Paper.published_date, Paper.id) < tuple_(last_date, last_id))
+    
+    if filters:
+        stmt = stmt.where(and_(*filters))
+    
+    return stmt.order_by(
+        desc(Paper.published_date), desc(Paper.id)
+    ).offset(skip).limit(limit)
+
+
+def get_papers(
+    db: Session,
+    skip: int = 0,
+    limit: int = 50,
+    query: Optional[str] = None,
+    category: Optional[str] = None,
+    tag_ids: Optional[List[int]] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    cursor: Optional[Tuple[Optional[datetime], int]] = None
+) -> List[Paper]:
+    """
+    获取论文列表（支持多条件筛选）
     
-    # 日期范围筛选
-    if start_date:
-        db_query = db_query.filter(Paper.published_date >= start_date)
-    if end_date:
-        db_query = db_query.filter(Paper.published_date <= end_date)
+    按 (published_date DESC, id DESC) 排序。传入 cursor（上一页最后一条的
+    (published_date, id)）时使用 keyset 分页，直接从索引定位到下一页，
+    避免 OFFSET 逐行扫描丢弃。
+    """
+    stmt = _papers_statement(
+        skip=skip,
+        limit=limit,
+        query=query,
+        category=category,
+        tag_ids=tag_ids,
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor
+    )
+    return db.scalars(stmt).all()
+
+
+def get_papers_page(
+    db: Session,
+    limit: int = 50,
+    cursor: Optional[Tuple[Optional[datetime], int]] = None,
+    **filters
+) -> Tuple[List[Paper], Optional[Tuple[Optional[datetime], int]]]:
+    """
+    keyset 分页获取论文
     
-    return db_query.order_by(desc(Paper.published_date)).offset(skip).limit(limit).all()
+    Returns:
+        (论文列表, 下一页 cursor)，没有下一页时 cursor 为 None
+    """
+    papers = get_papers(db, limit=limit, cursor=cursor, **filters)
+    next_cursor = None
+    if len(papers) == limit:
+        next_cursor = (papers[-1].published_date, papers[-1].id)
+    return papers, next_cursor
 
 
 def update_paper(db: Session, paper_id: int, paper_update: PaperUpdate) -> Optional[Paper]:
     """更新论文"""
-    db_paper = get_paper(db, paper_id)
+    db_paper = _get_paper_bare(db, paper_id)
     if not db_paper:
         return None
     
@@ -105,40 +341,59 @@ def update_paper(db: Session, paper_id: int, paper_update: PaperUpdate) -> Optio
     # 更新标签关联
     if paper_update.tag_ids is not None:
         # 删除旧关联
-        db.query(PaperTag).filter(PaperTag.paper_id == paper_id).delete()
+        db.query(PaperTag).filter(PaperTag.paper_id == paper_id).delete(synchronize_session=False)
         # 添加新关联
-        for tag_id in paper_update.tag_ids:
-            paper_tag = PaperTag(paper_id=paper_id, tag_id=tag_id)
-            db.add(paper_tag)
+        _insert_paper_tags(db, paper_id, paper_update.tag_ids)
     
     db.commit()
-    db.refresh(db_paper)
+    if paper_update.tag_ids is not None:
+        # 标签关联是用批量语句改写的，已加载的集合需要失效
+        db.expire(db_paper, ['paper_tags'])
+    _invalidate_stats()
     return db_paper
 
 
 def delete_paper(db: Session, paper_id: int) -> bool:
     """删除论文"""
-    db_paper = get_paper(db, paper_id)
+    db_paper = _get_paper_bare(db, paper_id)
     if not db_paper:
         return False
     
     db.delete(db_paper)
     db.commit()
+    _invalidate_stats()
     return True
 
 
-def update_paper_embedding(db: Session, paper_id: int, embedding: List[float]) -> Optional[Paper]:
+def update_paper_embedding(
+    db: Session,
+    paper_id: int,
+    embedding: Union[np.ndarray, List[float]]
+) -> Optional[Paper]:
     """更新论文的 embedding"""
-    db_paper = get_paper(db, paper_id)
+    db_paper = _get_paper_bare(db, paper_id)
     if not db_paper:
         return None
     
     db_paper.embedding = embedding
     db.commit()
-    db.refresh(db_paper)
     return db_paper
 
 
+def update_paper_embeddings(
+    db: Session,
+    embeddings: Dict[int, Union[np.ndarray, List[float]]]
+) -> None:
+    """按主键批量更新 embedding（单条 executemany UPDATE，一次提交）"""
+    if not embeddings:
+        return
+    db.execute(
+        update(Paper),
+        [{"id": paper_id, "embedding": embedding} for paper_id, embedding in embeddings.items()]
+    )
+    db.commit()
+
+
 # ==================== Tag CRUD ====================
 
 def create_tag(db: Session, tag: TagCreate) -> Tag:
@@ -146,7 +401,7 @@ def create_tag(db: Session, tag: TagCreate) -> Tag:
     db_tag = Tag(name=tag.name, description=tag.description)
     db.add(db_tag)
     db.commit()
-    db.refresh(db_tag)
+    _invalidate_stats()
     return db_tag
 
 
@@ -156,8 +411,15 @@ def get_tag(db: Session, tag_id: int) -> Optional[Tag]:
 
 
 def get_tag_by_name(db: Session, name: str) -> Optional[Tag]:
-    """通过名称获取标签"""
-    return db.query(Tag).filter(Tag.name == name).first()
+    """通过名称获取标签（大小写不敏感，走 lower(name) 唯一索引）"""
+    return db.query(Tag).filter(func.lower(Tag.name) == func.lower(name)).first()
+
+
+def search_tags(db: Session, query: str, limit: int = 50) -> List[Tag]:
+    """按名称模糊搜索标签（ILIKE 走 pg_trgm GIN 索引）"""
+    return db.query(Tag).filter(
+        Tag.name.ilike(f"%{query}%")
+    ).order_by(Tag.name).limit(limit).all()
 
 
 def get_tags(db: Session, skip: int = 0, limit: int = 100) -> List[Tag]:
@@ -173,6 +435,35 @@ def get_or_create_tag(db: Session, name: str, description: Optional[str] = None)
     return tag
 
 
+def get_tag_paper_counts(db: Session) -> Dict[int, int]:
+    """获取每个标签关联的论文数量 {tag_id: count}（单条 GROUP BY 查询）"""
+    results = db.query(PaperTag.tag_id, func.count(PaperTag.paper_id)).group_by(
+        PaperTag.tag_id
+    ).all()
+    return {tag_id: count for tag_id, count in results}
+
+
+def add_paper_tag(db: Session, paper_id: int, tag_id: int) -> bool:
+    """为论文添加标签（单条 INSERT ... ON CONFLICT DO NOTHING，无需先查询）"""
+    result = db.execute(
+        pg_insert(PaperTag).values(paper_id=paper_id, tag_id=tag_id).on_conflict_do_nothing(
+            index_elements=[PaperTag.paper_id, PaperTag.tag_id]
+        )
+    )
+    db.commit()
+    return result.rowcount > 0
+
+
+def remove_paper_tag(db: Session, paper_id: int, tag_id: int) -> bool:
+    """移除论文的标签（单条 DELETE，无需先加载关联记录）"""
+    result = db.execute(
+        delete(PaperTag).where(PaperTag.paper_id == paper_id, PaperTag.tag_id == tag_id),
+        execution_options={"synchronize_session": False}
+    )
+    db.commit()
+    return result.rowcount > 0
+
+
 def delete_tag(db: Session, tag_id: int) -> bool:
     """删除标签"""
     db_tag = get_tag(db, tag_id)
@@ -181,6 +472,7 @@ def delete_tag(db: Session, tag_id: int) -> bool:
     
     db.delete(db_tag)
     db.commit()
+    _invalidate_stats()
     return True
 
 
@@ -196,7 +488,6 @@ def create_reading_history(db: Session, history: ReadingHistoryCreate) -> Readin
     )
     db.add(db_history)
     db.commit()
-    db.refresh(db_history)
     return db_history
 
 
@@ -207,6 +498,17 @@ def get_reading_history(db: Session, history_id: int) -> Optional[ReadingHistory
     ).filter(ReadingHistory.id == history_id).first()
 
 
+def _reading_histories_statement(user_id: str, skip: int, limit: int):
+    """构建阅读历史列表查询语句（同步 / 异步查询共用）"""
+    return select(ReadingHistory).options(
+        selectinload(ReadingHistory.paper).load_only(*LIST_COLUMNS)
+    ).where(
+        ReadingHistory.user_id == user_id
+    ).order_by(
+        desc(ReadingHistory.read_at)
+    ).offset(skip).limit(limit)
+
+
 def get_reading_histories(
     db: Session,
     user_id: str = "default_user",
@@ -214,13 +516,7 @@ def get_reading_histories(
     limit: int = 50
 ) -> List[ReadingHistory]:
     """获取用户阅读历史列表"""
-    return db.query(ReadingHistory).options(
-        joinedload(ReadingHistory.paper)
-    ).filter(
-        ReadingHistory.user_id == user_id
-    ).order_by(
-        desc(ReadingHistory.read_at)
-    ).offset(skip).limit(limit).all()
+    return db.scalars(_reading_histories_statement(user_id, skip, limit)).all()
 
 
 def get_user_read_paper_ids(db: Session, user_id: str = "default_user") -> List[int]:
@@ -231,6 +527,20 @@ def get_user_read_paper_ids(db: Session, user_id: str = "default_user") -> List[
     return [r[0] for r in results]
 
 
+def user_read_paper_ids_subq(user_id: str = "default_user", limit: Optional[int] = None):
+    """
+    用户已读论文 ID 子查询，供其他查询在数据库内做 IN / NOT IN 过滤，
+    避免把 ID 列表取回 Python 再拼回 SQL；指定 limit 时取最近阅读的 limit 篇
+    """
+    stmt = select(ReadingHistory.paper_id).where(
+        ReadingHistory.user_id == user_id
+    ).group_by(ReadingHistory.paper_id)
+    if limit is not None:
+        # 按 (user_id, read_at DESC) INCLUDE (paper_id) 索引只扫描该用户的记录
+        stmt = stmt.order_by(func.max(ReadingHistory.read_at).desc()).limit(limit)
+    return stmt.subquery()
+
+
 def delete_reading_history(db: Session, history_id: int) -> bool:
     """删除阅读历史"""
     db_history = get_reading_history(db, history_id)
@@ -244,19 +554,59 @@ def delete_reading_history(db: Session, history_id: int) -> bool:
 
 # ==================== 统计函数 ====================
 
+@cached(_stat_cache, key=lambda db: hashkey('get_paper_count'), lock=_stat_lock)
 def get_paper_count(db: Session) -> int:
     """获取论文总数"""
     return db.query(func.count(Paper.id)).scalar()
 
 
+def get_paper_count_estimate(db: Session) -> int:
+    """获取论文总数的近似值（读取 pg_class 统计信息，不扫表）"""
+    estimate = db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'papers'")
+    ).scalar()
+    # 表从未 ANALYZE 时 reltuples 为 -1，退回精确计数
+    if estimate is None or estimate < 0:
+        return get_paper_count(db)
+    return estimate
+
+
+@cached(_stat_cache, key=lambda db: hashkey('get_tag_count'), lock=_stat_lock)
 def get_tag_count(db: Session) -> int:
     """获取标签总数"""
     return db.query(func.count(Tag.id)).scalar()
 
 
+@cached(_stat_cache, key=lambda db: hashkey('get_categories'), lock=_stat_lock)
 def get_categories(db: Session) -> List[str]:
     """获取所有论文类别"""
     results = db.query(Paper.category).filter(
         Paper.category.isnot(None)
     ).distinct().all()
     return sorted([r[0] for r in results if r[0]])
+
+
+def get_category_counts(db: Session) -> List[Tuple[str, int]]:
+    """获取各类别的论文数量（单条 GROUP BY 查询）"""
+    return db.query(Paper.category, func.count(Paper.id)).filter(
+        Paper.category.isnot(None)
+    ).group_by(Paper.category).order_by(Paper.category).all()
+
+
+# ==================== 异步查询（AsyncSession） ====================
+
+async def get_papers_async(db: AsyncSession, **filters) -> List[Paper]:
+    """异步获取论文列表，参数同 get_papers"""
+    result = await db.scalars(_papers_statement(**filters))
+    return result.all()
+
+
+async def get_reading_histories_async(
+    db: AsyncSession,
+    user_id: str = "default_user",
+    skip: int = 0,
+    limit: int = 50
+) -> List[ReadingHistory]:
+    """异步获取用户阅读历史列表"""
+    result = await db.scalars(_reading_histories_statement(user_id, skip, limit))
+    return result.all()
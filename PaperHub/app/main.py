@@ -3,21 +3,27 @@ PaperHub - Personal Academic Paper Management and Recommendation System
 Streamlit Main Application
 """
 import streamlit as st
-from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
-from typing import List, Optional
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.engine import Engine
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import atexit
+import weakref
 import pandas as pd
 
-from app.database import SessionLocal, init_db
+from app.database import engine, init_db
 from app.models import Paper, Tag
 from app import crud
 from app.schemas import PaperCreate, TagCreate, ReadingHistoryCreate
-from app.recommender import recommender
+from app.recommender import PaperRecommender, build_recommender
 from app.utils import (
     search_arxiv_papers,
     fetch_arxiv_by_id,
     format_authors,
     truncate_text,
+    format_authors_series,
+    truncate_text_series,
     get_arxiv_categories,
     extract_arxiv_id
 )
@@ -32,16 +38,139 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Above this many tags the tag filter switches to server-side search
+TAG_SEARCH_THRESHOLD = 200
+TAG_SEARCH_LIMIT = 50
+
 
 # ==================== Database Session Management ====================
 
+@st.cache_resource
+def _ensure_schema() -> bool:
+    """Run one-time schema setup once per process; failures are not cached and retry on the next rerun"""
+    init_db()
+    return True
+
+
+@st.cache_resource
+def get_engine() -> Engine:
+    """Shared SQLAlchemy engine; the pool is opened once per process"""
+    with engine.connect():
+        pass
+    return engine
+
+
+@st.cache_resource
+def get_session_factory() -> sessionmaker:
+    """Session factory bound to the shared engine"""
+    return sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=get_engine())
+
+
+@st.cache_resource
+def get_recommender() -> PaperRecommender:
+    """Recommender (and its encoder) shared across reruns and sessions"""
+    paper_recommender = build_recommender()
+    # Load the encoder weights off the UI thread as soon as the process starts, so the first
+    # embedding request doesn't pay the warmup; load_model is locked, early callers just wait
+    preload = get_embedding_executor().submit(paper_recommender.load_model)
+    preload.add_done_callback(_report_preload_failure)
+    return paper_recommender
+
+
+def _report_preload_failure(future: Future):
+    """Log why the background encoder preload failed; the next embedding call retries the load"""
+    error = future.exception()
+    if error is not None:
+        print(f"Encoder preload failed: {error!r}")
+
+
+@st.cache_resource
+def _session_registry() -> weakref.WeakSet:
+    """Sessions kept in st.session_state; closed when the process exits"""
+    sessions = weakref.WeakSet()
+    atexit.register(lambda: [db.close() for db in list(sessions)])
+    return sessions
+
+
 def get_db():
-    """Get database session"""
-    db = SessionLocal()
+    """Get the database session of this browser session, reused across reruns"""
+    if "db_session" not in st.session_state:
+        db = get_session_factory()()
+        _session_registry().add(db)
+        st.session_state.db_session = db
+    db = st.session_state.db_session
+    # Start each rerun with a fresh transaction; also clears a failed one
+    # left behind by an exception in the previous run
+    db.rollback()
+    return db
+
+
+# ==================== Cached Queries ====================
+
+@st.cache_data(ttl=60)
+def cached_get_tags(_db: Session) -> List[Tuple[int, str]]:
+    """Get all tags as (id, name) tuples, cached across reruns"""
+    return [(tag.id, tag.name) for tag in crud.get_tags(_db, limit=TAG_SEARCH_THRESHOLD)]
+
+
+@st.cache_data(ttl=60, max_entries=128)
+def cached_search_tags(query: str, _db: Session) -> List[Tuple[int, str]]:
+    """Search tags by name as (id, name) tuples, cached per query"""
+    return [(tag.id, tag.name) for tag in crud.search_tags(_db, query, limit=TAG_SEARCH_LIMIT)]
+
+
+@st.cache_data(ttl=60)
+def cached_get_categories(_db: Session) -> List[str]:
+    """Get all paper categories, cached across reruns"""
+    return crud.get_categories(_db)
+
+
+@st.cache_data(ttl=30)
+def cached_get_category_counts(_db: Session) -> List[Tuple[str, int]]:
+    """Get (category, paper count) pairs, cached across reruns"""
+    return [(category, count) for category, count in crud.get_category_counts(_db)]
+
+
+def clear_catalog_cache():
+    """Invalidate cached tags/categories after they change"""
+    cached_get_tags.clear()
+    cached_search_tags.clear()
+    cached_get_categories.clear()
+    cached_get_category_counts.clear()
+
+
+# ==================== Background Embedding ====================
+
+@st.cache_resource
+def get_embedding_executor() -> ThreadPoolExecutor:
+    """Worker pool for embedding jobs, shared across reruns and sessions"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="embedding")
+
+
+def _embed_papers_job(
+    session_factory: sessionmaker,
+    paper_recommender: PaperRecommender,
+    paper_ids: List[int],
+    texts: List[str]
+):
+    """Compute embeddings for imported papers and store them (runs off the UI thread)"""
+    db = session_factory()
     try:
-        return db
+        embeddings = paper_recommender.generate_embeddings_batch(texts)
+        crud.update_paper_embeddings(db, dict(zip(paper_ids, embeddings)))
+    except Exception as e:
+        db.rollback()
+        print(f"Background embedding failed: {e}")
     finally:
-        pass  # Close at page end
+        db.close()
+
+
+def schedule_embeddings(paper_ids: List[int], texts: List[str]):
+    """Queue embedding generation for papers imported without one"""
+    if paper_ids:
+        get_embedding_executor().submit(
+            _embed_papers_job, get_session_factory(), get_recommender(), paper_ids, texts
+        )
 
 
 # ==================== Sidebar Navigation ====================
@@ -62,6 +191,8 @@ def render_sidebar():
         st.markdown("### Quick Actions")
         
         if st.button("🔄 Refresh Data"):
+            st.session_state.reading_dirty = True
+            st.session_state.papers_dirty = True
             st.rerun()
         
         return page
@@ -73,104 +204,139 @@ def render_home_page(db: Session):
     """Render home page"""
     st.title("🏠 Paper Library")
     
-    # Search and filter area
-    col1, col2, col3 = st.columns([3, 1, 1])
-    
-    with col1:
-        search_query = st.text_input("🔍 Search Papers (Title/Abstract)", placeholder="Enter keywords...")
-    
-    with col2:
-        categories = crud.get_categories(db)
-        category_filter = st.selectbox(
-            "Category Filter",
-            ["All"] + categories
-        )
-    
-    with col3:
-        tags = crud.get_tags(db)
-        tag_options = {tag.name: tag.id for tag in tags}
-        selected_tags = st.multiselect("Tag Filter", options=list(tag_options.keys()))
-    
-    # Date range filter
-    col4, col5 = st.columns(2)
-    with col4:
-        use_date_filter = st.checkbox("Enable Date Filter")
-    
-    start_date, end_date = None, None
-    if use_date_filter:
+    paper_list_fragment(db)
+
+
+@st.fragment
+def paper_list_fragment(db: Session):
+    """Filters and paper list; reruns on its own when filters are applied"""
+    # Search and filter area: widgets inside the form only rerun on submit
+    with st.form("paper_filters"):
+        if crud.get_tag_count(db) > TAG_SEARCH_THRESHOLD:
+            # Too many tags to render in one dropdown: search server-side and keep already
+            # selected tags among the options. The search is part of the form, so a new search
+            # and the tags picked so far are submitted together and no pending pick is dropped
+            tag_query = st.text_input("Tag Search", placeholder="Type to search tags, then apply...")
+            matches = cached_search_tags(tag_query.strip(), db) if tag_query.strip() else []
+            tags = list(dict.fromkeys(st.session_state.get("tag_filter", []) + matches))
+        else:
+            tags = cached_get_tags(db)
+        
+        col1, col2, col3 = st.columns([3, 1, 1])
+        
+        with col1:
+            search_query = st.text_input("🔍 Search Papers (Title/Abstract)", placeholder="Enter keywords...")
+        
+        with col2:
+            categories = cached_get_categories(db)
+            category_filter = st.selectbox(
+                "Category Filter",
+                ["All"] + categories
+            )
+        
+        with col3:
+            selected_tags = st.multiselect(
+                "Tag Filter", options=tags, format_func=lambda tag: tag[1], key="tag_filter"
+            )
+        
+        # Date range filter
+        col4, col5 = st.columns(2)
+        with col4:
+            use_date_filter = st.checkbox("Enable Date Filter")
+        
         with col5:
+            today = date.today()
             date_range = st.date_input(
                 "Publication Date Range",
-                value=(datetime.now() - timedelta(days=365), datetime.now()),
-                max_value=datetime.now()
+                value=(today - timedelta(days=365), today),
+                max_value=today
             )
-            if len(date_range) == 2:
-                start_date, end_date = date_range
+        
+        submitted = st.form_submit_button("Apply Filters", use_container_width=True)
+    
+    # Keep the last applied filters; other reruns reuse them as-is
+    if submitted or "filters" not in st.session_state:
+        start_date, end_date = None, None
+        if use_date_filter and len(date_range) == 2:
+            start_date, end_date = date_range
+        
+        st.session_state.filters = {
+            "query": search_query if search_query else None,
+            "category": None if category_filter == "All" else category_filter,
+            "tag_ids": [tag_id for tag_id, _ in selected_tags] if selected_tags else None,
+            "start_date": start_date,
+            "end_date": end_date
+        }
     
     # Query papers
-    tag_ids = [tag_options[name] for name in selected_tags] if selected_tags else None
-    category = None if category_filter == "All" else category_filter
-    
-    papers = crud.get_papers(
-        db,
-        query=search_query if search_query else None,
-        category=category,
-        tag_ids=tag_ids,
-        start_date=start_date,
-        end_date=end_date,
-        limit=50
-    )
+    papers = crud.get_papers(db, limit=50, **st.session_state.filters)
     
     # Display statistics
     st.markdown(f"**Found {len(papers)} papers**")
     
     # Display paper list
     if papers:
-        for paper in papers:
-            render_paper_card(db, paper)
+        render_paper_table(db, papers)
     else:
         st.info("No papers yet. Please import data first.")
-
-
-def render_paper_card(db: Session, paper: Paper):
-    """Render paper card"""
-    with st.container():
-        col1, col2 = st.columns([5, 1])
-        
-        with col1:
-            # Title (clickable for details)
-            if st.button(f"📄 {paper.title}", key=f"title_{paper.id}", use_container_width=True):
-                st.session_state.selected_paper_id = paper.id
-                st.session_state.nav_request = "📄 Paper Details"
-                st.rerun()
-            
-            # Authors and date
-            author_str = format_authors(paper.authors, max_display=3)
-            date_str = paper.published_date.strftime("%Y-%m-%d") if paper.published_date else "Unknown"
-            st.caption(f"👤 {author_str} | 📅 {date_str} | 🏷️ {paper.category or 'N/A'}")
-            
-            # Abstract
-            if paper.abstract:
-                st.text(truncate_text(paper.abstract, max_length=200))
-            
-            # Tags
-            paper_tags = [pt.tag.name for pt in paper.paper_tags]
-            if paper_tags:
-                st.markdown(" ".join([f"`{tag}`" for tag in paper_tags]))
-        
-        with col2:
-            if paper.pdf_url:
-                st.link_button("📥 PDF", paper.pdf_url, use_container_width=True)
-            
-            if st.button("✅ Mark as Read", key=f"read_{paper.id}", use_container_width=True):
-                crud.create_reading_history(
-                    db,
-                    ReadingHistoryCreate(paper_id=paper.id, user_id="default_user")
-                )
-                st.success("Marked as read!")
-                st.rerun()
-        
-        st.markdown("---")
+    
+    # Fragment-only reruns skip the end of main(), so release the connection here too
+    db.rollback()
+
+
+def render_paper_table(db: Session, papers: List[Paper]):
+    """Render the paper list as one selectable table"""
+    # Project the rows once, then format whole columns with pandas string ops
+    df = pd.DataFrame([
+        {
+            "Title": paper.title,
+            "Authors": paper.authors,
+            "Date": paper.published_date,
+            "Category": paper.category or "N/A",
+            "Tags": [pt.tag.name for pt in paper.paper_tags],
+            "Abstract": paper.abstract,
+            "PDF": paper.pdf_url
+        }
+        for paper in papers
+    ])
+    df["Authors"] = format_authors_series(df["Authors"], max_display=3)
+    df["Tags"] = df["Tags"].str.join(", ")
+    df["Abstract"] = truncate_text_series(df["Abstract"], max_length=200)
+    df["Date"] = pd.to_datetime(df["Date"]).dt.strftime("%Y-%m-%d").fillna("Unknown")
+    
+    event = st.dataframe(
+        df,
+        key="paper_table",
+        on_select="rerun",
+        selection_mode="single-row",
+        hide_index=True,
+        use_container_width=True,
+        column_config={"PDF": st.column_config.LinkColumn("PDF", display_text="📥 PDF")}
+    )
+    
+    selected_rows = [row for row in event.selection.rows if row < len(papers)]
+    if not selected_rows:
+        st.caption("Select a row to open the paper or mark it as read")
+        return
+    
+    paper = papers[selected_rows[0]]
+    st.session_state.selected_paper_id = paper.id
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button(f"📄 Open: {truncate_text(paper.title, 60)}", use_container_width=True):
+            st.session_state.nav_request = "📄 Paper Details"
+            st.rerun()
+    
+    with col2:
+        if st.button("✅ Mark as Read", key=f"read_{paper.id}", use_container_width=True):
+            crud.create_reading_history(
+                db,
+                ReadingHistoryCreate(paper_id=paper.id, user_id="default_user")
+            )
+            st.session_state.reading_dirty = True
+            st.toast("Marked as read!")
+            st.rerun(scope="fragment")
 
 
 # ==================== Paper Detail Page ====================
@@ -213,6 +379,7 @@ def render_paper_detail_page(db: Session):
                 db,
                 ReadingHistoryCreate(paper_id=paper.id, user_id="default_user")
             )
+            st.session_state.reading_dirty = True
             st.success("Marked as read!")
     
     # Tags
@@ -230,14 +397,7 @@ def render_paper_detail_page(db: Session):
             with cols[idx]:
                 if st.button(f"❌ {tag.name}", key=f"remove_tag_{tag.id}", use_container_width=True):
                     # Remove tag from paper
-                    from app.models import PaperTag
-                    paper_tag = db.query(PaperTag).filter(
-                        PaperTag.paper_id == paper.id,
-                        PaperTag.tag_id == tag.id
-                    ).first()
-                    if paper_tag:
-                        db.delete(paper_tag)
-                        db.commit()
+                    if crud.remove_paper_tag(db, paper.id, tag.id):
                         st.success(f"Tag '{tag.name}' removed!")
                         st.rerun()
     else:
@@ -245,28 +405,25 @@ def render_paper_detail_page(db: Session):
     
     # Add new tag
     st.markdown("**Add Tag:**")
-    all_tags = crud.get_tags(db)
-    available_tags = [tag for tag in all_tags if tag.name not in current_tag_names]
+    all_tags = cached_get_tags(db)
+    available_tags = [tag for tag in all_tags if tag[1] not in current_tag_names]
     
     if available_tags:
         col1, col2 = st.columns([3, 1])
         with col1:
             tag_to_add = st.selectbox(
                 "Select a tag to add",
-                options=[tag.name for tag in available_tags],
+                options=available_tags,
+                format_func=lambda tag: tag[1],
                 key="tag_selector"
             )
         with col2:
             st.write("")
             if st.button("➕ Add Tag", use_container_width=True):
-                # Find tag by name
-                tag = next((t for t in available_tags if t.name == tag_to_add), None)
-                if tag:
-                    from app.models import PaperTag
-                    paper_tag = PaperTag(paper_id=paper.id, tag_id=tag.id)
-                    db.add(paper_tag)
-                    db.commit()
-                    st.success(f"Tag '{tag.name}' added!")
+                if tag_to_add:
+                    tag_id, tag_name = tag_to_add
+                    crud.add_paper_tag(db, paper.id, tag_id)
+                    st.success(f"Tag '{tag_name}' added!")
                     st.rerun()
     else:
         st.caption("All available tags are already added to this paper")
@@ -286,12 +443,12 @@ def render_paper_detail_page(db: Session):
     if paper.embedding is None:
         if st.button("Generate Recommendations (Generate embedding first)"):
             with st.spinner("Generating embedding..."):
-                embedding = recommender.generate_paper_embedding(paper)
+                embedding = get_recommender().generate_paper_embedding(paper)
                 crud.update_paper_embedding(db, paper.id, embedding)
                 st.success("Embedding generated!")
                 st.rerun()
     else:
-        similar_papers = recommender.recommend_by_paper(db, paper.id, limit=5)
+        similar_papers = get_recommender().recommend_by_paper(db, paper.id, limit=5)
         
         if similar_papers:
             for similar_paper, score in similar_papers:
@@ -317,25 +474,34 @@ def render_recommendation_page(db: Session):
     """Render recommendation page"""
     st.title("🎯 Smart Recommendations")
     
+    # Reading history and paper options live in session_state and are only
+    # re-queried after a mutation marks them dirty
+    if st.session_state.get("reading_histories_cache") is None or st.session_state.get("reading_dirty"):
+        st.session_state.reading_histories_cache = [
+            (history.paper.title, history.read_at.strftime('%Y-%m-%d %H:%M'))
+            for history in crud.get_reading_histories(db, user_id="default_user", limit=10)
+        ]
+        st.session_state.reading_dirty = False
+    
     tab1, tab2 = st.tabs(["📚 Based on Reading History", "🔍 Based on Current Paper"])
     
     with tab1:
         st.markdown("### History-Based")
         
         # Display reading history
-        reading_histories = crud.get_reading_histories(db, user_id="default_user", limit=10)
+        reading_histories = st.session_state.reading_histories_cache
         
         if reading_histories:
             st.markdown(f"**You have read {len(reading_histories)} papers**")
             
             with st.expander("View Reading History"):
-                for history in reading_histories:
-                    st.markdown(f"- {history.paper.title} ({history.read_at.strftime('%Y-%m-%d %H:%M')})")
+                for title, read_at in reading_histories:
+                    st.markdown(f"- {title} ({read_at})")
             
             # Generate recommendations
             if st.button("🎯 Generate Personalized Recommendations", use_container_width=True):
                 with st.spinner("Analyzing your reading preferences..."):
-                    recommendations = recommender.recommend_by_reading_history(
+                    recommendations = get_recommender().recommend_by_reading_history(
                         db,
                         user_id="default_user",
                         limit=10
@@ -373,24 +539,33 @@ def render_recommendation_page(db: Session):
     with tab2:
         st.markdown("### Recommendations Based on Specific Paper")
         
-        # Select paper
-        papers = crud.get_papers(db, limit=100)
-        paper_options = {f"{p.title[:50]}...": p.id for p in papers}
+        # Select paper: only (id, title) pairs matching the search are loaded
+        title_query = st.text_input("Search by title", placeholder="Type to filter papers...").strip()
+        
+        options_cache = st.session_state.get("paper_options_cache")
+        if options_cache is None or options_cache[0] != title_query or st.session_state.get("papers_dirty"):
+            options_cache = (title_query, crud.list_paper_titles(db, title_query or None, limit=50))
+            st.session_state.paper_options_cache = options_cache
+            st.session_state.papers_dirty = False
+        paper_options = options_cache[1]
         
         if paper_options:
-            selected_title = st.selectbox("Select a paper", options=list(paper_options.keys()))
-            selected_id = paper_options[selected_title]
+            selected_id, _ = st.selectbox(
+                "Select a paper",
+                options=paper_options,
+                format_func=lambda option: truncate_text(option[1], 80)
+            )
             
             if st.button("🎯 Find Similar Papers", use_container_width=True):
                 paper = crud.get_paper(db, selected_id)
                 
                 if paper.embedding is None:
                     with st.spinner("Generating embedding..."):
-                        embedding = recommender.generate_paper_embedding(paper)
+                        embedding = get_recommender().generate_paper_embedding(paper)
                         crud.update_paper_embedding(db, paper.id, embedding)
                 
                 with st.spinner("Searching for similar papers..."):
-                    similar_papers = recommender.recommend_by_paper(db, selected_id, limit=10)
+                    similar_papers = get_recommender().recommend_by_paper(db, selected_id, limit=10)
                     # Save to session_state
                     st.session_state.paper_recommendations = similar_papers
             
@@ -449,7 +624,7 @@ def render_import_page(db: Session):
             if query:
                 with st.spinner(f"Searching arXiv..."):
                     arxiv_papers = search_arxiv_papers(query, max_results=max_results)
-                    st.session_state.arxiv_results = arxiv_papers
+                    st.session_state.arxiv_results = with_date_strings(arxiv_papers)
                     st.success(f"Found {len(arxiv_papers)} papers!")
             else:
                 st.warning("Please enter a search query")
@@ -459,6 +634,11 @@ def render_import_page(db: Session):
             st.markdown("---")
             st.markdown("### Search Results")
             
+            # One IN query for all "already imported" badges
+            existing_ids = crud.existing_arxiv_ids(
+                db, [p['arxiv_id'] for p in st.session_state.arxiv_results]
+            )
+            
             for idx, paper_data in enumerate(st.session_state.arxiv_results):
                 with st.container():
                     col1, col2 = st.columns([4, 1])
@@ -467,16 +647,14 @@ def render_import_page(db: Session):
                         st.markdown(f"**{paper_data['title']}**")
                         st.caption(
                             f"👤 {format_authors(paper_data['authors'], 2)} | "
-                            f"📅 {paper_data['published_date'].strftime('%Y-%m-%d')} | "
+                            f"📅 {paper_data['date_str']} | "
                             f"🏷️ {paper_data['category']}"
                         )
                         st.text(truncate_text(paper_data['abstract'], 150))
                     
                     with col2:
                         # Check if already exists
-                        existing = crud.get_paper_by_arxiv_id(db, paper_data['arxiv_id'])
-                        
-                        if existing:
+                        if paper_data['arxiv_id'] in existing_ids:
                             st.success("✅ Imported")
                         else:
                             if st.button("➕ Import", key=f"import_{idx}", use_container_width=True):
@@ -512,7 +690,7 @@ def render_import_page(db: Session):
             with st.spinner(f"Fetching papers from {selected_category} category..."):
                 from app.utils import search_arxiv_by_category
                 arxiv_papers = search_arxiv_by_category(selected_category, max_results=max_results_cat)
-                st.session_state.arxiv_category_results = arxiv_papers
+                st.session_state.arxiv_category_results = with_date_strings(arxiv_papers)
                 st.success(f"Found {len(arxiv_papers)} papers!")
         
         # Display results
@@ -521,12 +699,7 @@ def render_import_page(db: Session):
             
             if st.button("📥 Import All", use_container_width=True):
                 with st.spinner("Importing in batch..."):
-                    imported_count = 0
-                    for paper_data in st.session_state.arxiv_category_results:
-                        existing = crud.get_paper_by_arxiv_id(db, paper_data['arxiv_id'])
-                        if not existing:
-                            import_paper_from_arxiv(db, paper_data)
-                            imported_count += 1
+                    imported_count = import_papers_from_arxiv(db, st.session_state.arxiv_category_results)
                     
                     st.success(f"Successfully imported {imported_count} papers!")
                     st.session_state.arxiv_category_results = []
@@ -539,43 +712,99 @@ def render_import_page(db: Session):
                     st.markdown(f"**{paper_data['title']}**")
                     st.caption(
                         f"👤 {format_authors(paper_data['authors'], 2)} | "
-                        f"📅 {paper_data['published_date'].strftime('%Y-%m-%d')}"
+                        f"📅 {paper_data['date_str']}"
                     )
                     st.markdown("---")
 
 
-def import_paper_from_arxiv(db: Session, paper_data: dict):
-    """Import paper from arXiv data"""
-    # Create paper
-    paper_create = PaperCreate(
+def with_date_strings(papers_data: List[dict]) -> List[dict]:
+    """Format publication dates once when results are stored, not on every rerun"""
+    for paper_data in papers_data:
+        published = paper_data.get('published_date')
+        paper_data['date_str'] = published.strftime('%Y-%m-%d') if published else "Unknown"
+    return papers_data
+
+
+def build_paper_create(paper_data: dict, tag_ids: Optional[List[int]] = None) -> PaperCreate:
+    """Build a PaperCreate from arXiv data"""
+    return PaperCreate(
         title=paper_data['title'],
         authors=paper_data['authors'],
         abstract=paper_data['abstract'],
         pdf_url=paper_data['pdf_url'],
         arxiv_id=paper_data['arxiv_id'],
         category=paper_data['category'],
-        published_date=paper_data['published_date']
+        published_date=paper_data['published_date'],
+        tag_ids=tag_ids or []
     )
+
+
+def embedding_text(paper_data: dict) -> str:
+    """Text used to embed an arXiv paper"""
+    return f"{paper_data['title']} {paper_data['abstract'][:500]}"
+
+
+def import_paper_from_arxiv(db: Session, paper_data: dict):
+    """Import paper from arXiv data"""
+    # Skip known papers before creating tags or running the encoder
+    if crud.existing_arxiv_ids(db, [paper_data['arxiv_id']]):
+        st.info(f"Already imported: {paper_data['title'][:50]}...")
+        return
+    
+    # Auto create tags
+    tag_ids = [crud.get_or_create_tag(db, paper_data['category']).id] if paper_data['category'] else None
+    paper_create = build_paper_create(paper_data, tag_ids)
     
     # Generate embedding
     with st.spinner("Generating embedding..."):
-        text = f"{paper_data['title']} {paper_data['abstract'][:500]}"
-        embedding = recommender.generate_embedding(text)
+        embedding = get_recommender().generate_embedding(embedding_text(paper_data))
     
-    # Create paper
-    paper = crud.create_paper(db, paper_create, embedding=embedding)
+    # Paper and tag link are written in one transaction; a concurrent import
+    # of the same arXiv ID that got in after the check above is skipped by the unique index
+    if crud.upsert_paper_by_arxiv_id(db, paper_create, embedding=embedding) is None:
+        st.info(f"Already imported: {paper_data['title'][:50]}...")
+        return
     
-    # Auto create tags
-    if paper_data['category']:
-        tag = crud.get_or_create_tag(db, paper_data['category'])
-        from app.models import PaperTag
-        paper_tag = PaperTag(paper_id=paper.id, tag_id=tag.id)
-        db.add(paper_tag)
-        db.commit()
+    clear_catalog_cache()
+    st.session_state.papers_dirty = True
     
     st.success(f"✅ Successfully imported: {paper_data['title'][:50]}...")
 
 
+def import_papers_from_arxiv(db: Session, papers_data: List[dict]) -> int:
+    """Import a batch of arXiv papers in one commit; embeddings are filled in the background"""
+    existing_ids = crud.existing_arxiv_ids(db, [p['arxiv_id'] for p in papers_data])
+    new_papers = list({
+        p['arxiv_id']: p for p in papers_data if p['arxiv_id'] not in existing_ids
+    }.values())
+    if not new_papers:
+        return 0
+    
+    # Resolve each category tag once for the whole batch
+    category_tag_ids = {
+        category: crud.get_or_create_tag(db, category).id
+        for category in {p['category'] for p in new_papers if p['category']}
+    }
+    paper_creates = [
+        build_paper_create(p, [category_tag_ids[p['category']]] if p['category'] else None)
+        for p in new_papers
+    ]
+    
+    # Papers are stored without embeddings so the UI does not wait on the encoder;
+    # rows imported concurrently since the check above are skipped on conflict
+    inserted = crud.create_papers(db, paper_creates)
+    inserted_papers = [p for p in new_papers if p['arxiv_id'] in inserted]
+    schedule_embeddings(
+        [inserted[p['arxiv_id']] for p in inserted_papers],
+        [embedding_text(p) for p in inserted_papers]
+    )
+    
+    clear_catalog_cache()
+    st.session_state.papers_dirty = True
+    
+    return len(inserted_papers)
+
+
 # ==================== Tag Management Page ====================
 
 def render_tag_management_page(db: Session):
@@ -600,6 +829,7 @@ def render_tag_management_page(db: Session):
                         st.error("Tag already exists!")
                     else:
                         crud.create_tag(db, TagCreate(name=tag_name, description=tag_desc))
+                        clear_catalog_cache()
                         st.success(f"Tag '{tag_name}' created successfully!")
                         st.rerun()
                 else:
@@ -612,6 +842,7 @@ def render_tag_management_page(db: Session):
     tags = crud.get_tags(db, limit=100)
     
     if tags:
+        tag_paper_counts = crud.get_tag_paper_counts(db)
         for tag in tags:
             col1, col2, col3 = st.columns([3, 1, 1])
             
@@ -621,17 +852,12 @@ def render_tag_management_page(db: Session):
                     st.caption(tag.description)
             
             with col2:
-                # Count papers using this tag
-                paper_count = db.query(Paper).join(
-                    Paper.paper_tags
-                ).filter(
-                    Paper.paper_tags.any(tag_id=tag.id)
-                ).count()
-                st.metric("Papers", paper_count)
+                st.metric("Papers", tag_paper_counts.get(tag.id, 0))
             
             with col3:
                 if st.button("🗑️ Delete", key=f"delete_tag_{tag.id}"):
                     crud.delete_tag(db, tag.id)
+                    clear_catalog_cache()
                     st.success(f"Tag '{tag.name}' deleted")
                     st.rerun()
             
@@ -662,7 +888,7 @@ def render_statistics_page(db: Session):
         st.metric("✅ Read Papers", reading_count)
     
     with col4:
-        categories = crud.get_categories(db)
+        categories = cached_get_categories(db)
         st.metric("📂 Categories", len(categories))
     
     st.markdown("---")
@@ -670,10 +896,10 @@ def render_statistics_page(db: Session):
     # Statistics by category
     st.markdown("### 📂 Statistics by Category")
     
-    category_stats = []
-    for category in categories:
-        count = db.query(Paper).filter(Paper.category == category).count()
-        category_stats.append({"Category": category, "Papers": count})
+    category_stats = [
+        {"Category": category, "Papers": count}
+        for category, count in cached_get_category_counts(db)
+    ]
     
     if category_stats:
         df = pd.DataFrame(category_stats)
@@ -685,13 +911,10 @@ def render_statistics_page(db: Session):
     # Recently imported
     st.markdown("### 📅 Recently Imported Papers")
     
-    recent_papers = crud.get_papers(db, limit=10)
-    if recent_papers:
-        for paper in recent_papers:
-            st.markdown(
-                f"- **{paper.title}** "
-                f"({paper.created_at.strftime('%Y-%m-%d %H:%M')})"
-            )
+    recent = pd.DataFrame(crud.get_recent_paper_titles(db, limit=10), columns=["title", "created_at"])
+    if not recent.empty:
+        created = pd.to_datetime(recent["created_at"]).dt.strftime('%Y-%m-%d %H:%M')
+        st.markdown("\n".join("- **" + recent["title"] + "** (" + created + ")"))
     else:
         st.info("No papers yet")
 
@@ -700,13 +923,18 @@ def render_statistics_page(db: Session):
 
 def main():
     """Main function"""
-    # Initialize database
+    # Initialize database and open the connection pool (once per process); an unreachable
+    # database is reported here instead of surfacing later as a raw traceback
     try:
-        init_db()
+        _ensure_schema()
+        get_engine()
     except Exception as e:
         st.error(f"Database initialization failed: {e}")
         st.stop()
     
+    # Start preloading the encoder (once per process)
+    get_recommender()
+    
     # Get database session
     db = get_db()
     
@@ -733,8 +961,8 @@ def main():
     elif page == "📊 Statistics":
         render_statistics_page(db)
     
-    # Close database session
-    db.close()
+    # Return the connection to the pool; the session itself is kept for the next rerun
+    db.rollback()
 
 
 if __name__ == "__main__":
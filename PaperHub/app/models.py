@@ -1,10 +1,11 @@
 """
 数据库模型定义
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
-from pgvector.sqlalchemy import Vector as VECTOR
+from pgvector.sqlalchemy import HALFVEC
 from app.database import Base
 import datetime
 
@@ -21,13 +22,30 @@ class Paper(Base):
     arxiv_id = Column(String(50), unique=True, nullable=True, index=True)
     category = Column(String(100), nullable=True, index=True)
     published_date = Column(DateTime, nullable=True, index=True)
-    embedding = Column(VECTOR(384), nullable=True)  # 使用 all-MiniLM-L6-v2 生成的向量
+    # 使用 all-MiniLM-L6-v2 生成的向量，以半精度存储（行和 HNSW 索引体积减半，召回几乎不受影响）
+    embedding = Column(HALFVEC(384), nullable=True)
     created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow, nullable=False)
+    # 全文检索向量（数据库生成列，只用于 WHERE 条件，默认不加载）
+    search_vec = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(title, '') || ' ' || coalesce(abstract, ''))", persisted=True)
+    ))
 
     # 关系
-    paper_tags = relationship("PaperTag", back_populates="paper", cascade="all, delete-orphan")
-    reading_histories = relationship("ReadingHistory", back_populates="paper", cascade="all, delete-orphan")
+    # passive_deletes: 删除论文时由外键 ON DELETE CASCADE 清理子表，无需先加载子记录
+    paper_tags = relationship("PaperTag", back_populates="paper", cascade="all, delete-orphan", passive_deletes=True)
+    reading_histories = relationship("ReadingHistory", back_populates="paper", cascade="all, delete-orphan", passive_deletes=True)
+
+    # 全文检索 GIN 索引 + 标题子串匹配的 pg_trgm 索引
+    # 向量近邻检索索引（ix_papers_embedding_hnsw / ix_papers_embedding_ivfflat）的类型和参数取决于
+    # 迁移时的环境变量与数据量，只由 Alembic 迁移创建，不在模型中声明
+    __table_args__ = (
+        Index('ix_papers_search_gin', 'search_vec', postgresql_using='gin'),
+        Index('ix_papers_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+        # 列表排序 / keyset 分页：(published_date DESC, id DESC) 由反向索引扫描提供
+        Index('ix_papers_published_date_id', 'published_date', 'id'),
+    )
 
     def __repr__(self):
         return f"<Paper(id={self.id}, title={self.title[:50]}...)>"
@@ -45,6 +63,12 @@ class Tag(Base):
     # 关系
     paper_tags = relationship("PaperTag", back_populates="tag", cascade="all, delete-orphan")
 
+    # 大小写不敏感的唯一索引 + 标签模糊搜索的 pg_trgm 索引
+    __table_args__ = (
+        Index('ix_tags_name_lower', func.lower(name), unique=True),
+        Index('ix_tags_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+    )
+
     def __repr__(self):
         return f"<Tag(id={self.id}, name={self.name})>"
 
@@ -77,13 +101,21 @@ class ReadingHistory(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     paper_id = Column(Integer, ForeignKey("papers.id", ondelete="CASCADE"), nullable=False)
-    user_id = Column(String(100), default="default_user", nullable=False, index=True)  # 支持多用户扩展
-    read_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False, index=True)
+    user_id = Column(String(100), default="default_user", nullable=False)  # 支持多用户扩展
+    read_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
     rating = Column(Integer, nullable=True)  # 评分 1-5
     notes = Column(Text, nullable=True)  # 用户笔记
 
     # 关系
     paper = relationship("Paper", back_populates="reading_histories")
 
+    # 按用户查已读论文 ID 可走 index-only scan；
+    # 按用户取最近阅读记录直接按 (user_id, read_at DESC) 顺序扫描，INCLUDE paper_id 免回表
+    __table_args__ = (
+        Index('ix_reading_histories_user_paper', 'user_id', 'paper_id'),
+        Index('ix_reading_histories_user_read_at', 'user_id', read_at.desc(),
+              postgresql_include=['paper_id']),
+    )
+
     def __repr__(self):
         return f"<ReadingHistory(id={self.id}, paper_id={self.paper_id}, user_id={self.user_id})>"
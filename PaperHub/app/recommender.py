@@ -2,15 +2,84 @@
 智能推荐引擎
 基于 sentence-transformers 的语义相似度推荐
 """
+import os
+
+# 编码使用的 CPU 线程数；OMP_NUM_THREADS 必须在导入 torch（由 sentence_transformers 间接导入）之前设置
+EMBEDDING_NUM_THREADS = int(os.getenv("EMBEDDING_NUM_THREADS", str(os.cpu_count() or 1)))
+os.environ.setdefault("OMP_NUM_THREADS", str(EMBEDDING_NUM_THREADS))
+
 from sentence_transformers import SentenceTransformer
-from typing import List, Tuple, Optional
+from typing import Any, List, NamedTuple, Tuple, Optional, Union
+import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import event, func, text, select
+from cachetools import TTLCache
 import numpy as np
-import os
+import threading
+import time
+
+from pgvector import HalfVector
 
 from app.models import Paper
-from app.crud import get_user_read_paper_ids
+from app.crud import user_read_paper_ids_subq, get_paper_count_estimate
+
+
+# HNSW 检索时的候选队列大小（pgvector 默认 40），越大召回越高、查询越慢
+# 按论文数量分档：(论文数上限, ef_search)，超过最后一档使用 HNSW_EF_SEARCH_MAX
+HNSW_EF_SEARCH_LADDER = ((100_000, 40), (1_000_000, 100))
+HNSW_EF_SEARCH_MAX = 200
+
+# 向量索引类型：hnsw（默认）或 ivfflat，须与执行 Alembic 迁移时的设置一致
+VECTOR_INDEX_TYPE = os.getenv("VECTOR_INDEX_TYPE", "hnsw").lower()
+
+# IVFFlat 检索时探查的聚类数（pgvector 默认 1），越大召回越高、查询越慢
+IVFFLAT_PROBES = 10
+
+# 论文数量估计值的刷新间隔（秒）
+PAPER_COUNT_REFRESH_SECONDS = 600
+
+# 单篇论文相似推荐的结果缓存：(paper_id, 排除 ID, limit) -> [(PaperRow, 相似度)]
+# 5 分钟过期；论文新增 / 修改 / 删除时整体清空（见文件末尾的事件监听）
+_similar_cache = TTLCache(maxsize=10_000, ttl=300)
+_similar_lock = threading.RLock()
+
+# 推理后端：torch（默认）或 onnx。onnx 使用模型仓库自带的 INT8 动态量化 ONNX 文件，
+# CPU 上明显快于 FP32 PyTorch；需要安装 sentence-transformers[onnx]
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+EMBEDDING_ONNX_FILE = os.getenv("EMBEDDING_ONNX_FILE", "onnx/model_qint8_avx512_vnni.onnx")
+
+
+class PaperRow(NamedTuple):
+    """向量检索结果中的论文行（只读轻量对象，不经过 ORM 属性插桩）"""
+    id: int
+    title: str
+    authors: Any
+    abstract: Optional[str]
+    pdf_url: Optional[str]
+    arxiv_id: Optional[str]
+    category: Optional[str]
+    published_date: Optional[datetime.datetime]
+    created_at: Optional[datetime.datetime]
+    updated_at: Optional[datetime.datetime]
+
+
+# 检索 SQL 的 SELECT 列与 PaperRow 字段一一对应
+_PAPER_ROW_COLUMNS = ", ".join(PaperRow._fields)
+
+
+def as_float_array(embedding) -> np.ndarray:
+    """embedding 统一转为 float32 ndarray（数据库读出的 halfvec 为 HalfVector 对象）"""
+    if isinstance(embedding, HalfVector):
+        return embedding.to_numpy().astype(np.float32)
+    return np.asarray(embedding, dtype=np.float32)
+
+
+def l2_normalize(vector: np.ndarray) -> np.ndarray:
+    """原地 L2 归一化（零向量保持不变）"""
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
 
 
 class PaperRecommender:
@@ -25,16 +94,55 @@ class PaperRecommender:
         """
         self.model_name = model_name
         self.model = None
+        # 实际加载的推理后端（ONNX 不可用时与 EMBEDDING_BACKEND 不同）
+        self.backend = None
         self.dimension = 384  # all-MiniLM-L6-v2 的向量维度
+        # 后台 embedding 任务与页面线程可能同时触发加载
+        self._load_lock = threading.Lock()
+        # 论文数量估计值及其获取时间，用于选择 ef_search
+        self._paper_count = None
+        self._paper_count_at = 0.0
     
     def load_model(self):
         """延迟加载模型（避免启动时占用过多资源）"""
         if self.model is None:
-            print(f"正在加载模型: {self.model_name}...")
-            self.model = SentenceTransformer(self.model_name)
-            print("模型加载完成！")
+            with self._load_lock:
+                if self.model is None:
+                    print(f"正在加载模型: {self.model_name}（请求后端: {EMBEDDING_BACKEND}）...")
+                    self._configure_threads()
+                    self.model = self._create_model()
+                    print(f"模型加载完成！实际后端: {self.backend}")
     
-    def generate_embedding(self, text: str) -> List[float]:
+    @staticmethod
+    def _configure_threads():
+        """显式设置 PyTorch 线程数，避免部分部署环境下只用单核编码"""
+        import torch
+        torch.set_num_threads(EMBEDDING_NUM_THREADS)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # 只能在首次并行计算前设置一次，已设置过时忽略
+            pass
+    
+    def _create_model(self) -> SentenceTransformer:
+        """按 EMBEDDING_BACKEND 创建模型；ONNX 后端不可用时退回 PyTorch"""
+        if EMBEDDING_BACKEND == "onnx":
+            try:
+                model = SentenceTransformer(
+                    self.model_name,
+                    backend="onnx",
+                    model_kwargs={"file_name": EMBEDDING_ONNX_FILE}
+                )
+                self.backend = "onnx"
+                return model
+            except (ImportError, OSError) as e:
+                # 缺少 onnx 依赖或模型文件时才退回；INT8 与 FP32 的向量会混存在同一列，需留意日志
+                print(f"警告：ONNX 后端加载失败，改用 PyTorch（FP32）: {e}")
+        model = SentenceTransformer(self.model_name)
+        self.backend = "torch"
+        return model
+    
+    def generate_embedding(self, text: str) -> np.ndarray:
         """
         生成文本的 embedding
         
@@ -42,13 +150,38 @@ class PaperRecommender:
             text: 输入文本
             
         Returns:
-            embedding 向量
+            embedding 向量（float32 ndarray，已 L2 归一化，可直接写入 pgvector 列）
         """
         self.load_model()
-        embedding = self.model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        return self.model.encode(
+            text, convert_to_numpy=True, normalize_embeddings=True
+        ).astype(np.float32, copy=False)
     
-    def generate_paper_embedding(self, paper: Paper) -> List[float]:
+    def generate_embeddings_batch(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """
+        批量生成文本的 embedding（按批前向计算，比逐条调用快得多）
+        
+        encode 内部会先按文本长度排序再分批，同一批内长度相近，padding 浪费最少
+        
+        Args:
+            texts: 输入文本列表
+            batch_size: 每批文本数
+            
+        Returns:
+            形状为 (len(texts), dimension) 的 float32 ndarray，已 L2 归一化
+        """
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        self.load_model()
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        ).astype(np.float32, copy=False)
+    
+    def generate_paper_embedding(self, paper: Paper) -> np.ndarray:
         """
         生成论文的 embedding（基于标题和摘要）
         
@@ -66,13 +199,30 @@ class PaperRecommender:
         combined_text = " ".join(text_parts)
         return self.generate_embedding(combined_text)
     
+    def ef_search_for(self, db: Session) -> int:
+        """
+        按论文数量选择 hnsw.ef_search：小库保持快速，大库保证召回
+        
+        论文数量读取 pg_class 估计值，每 PAPER_COUNT_REFRESH_SECONDS 秒刷新一次
+        """
+        now = time.monotonic()
+        if self._paper_count is None or now - self._paper_count_at > PAPER_COUNT_REFRESH_SECONDS:
+            self._paper_count = get_paper_count_estimate(db)
+            self._paper_count_at = now
+        
+        for max_count, ef_search in HNSW_EF_SEARCH_LADDER:
+            if self._paper_count < max_count:
+                return ef_search
+        return HNSW_EF_SEARCH_MAX
+    
     def find_similar_papers(
         self,
         db: Session,
-        query_embedding: List[float],
+        query_embedding: Union[np.ndarray, List[float]],
         limit: int = 10,
-        exclude_ids: Optional[List[int]] = None
-    ) -> List[Tuple[Paper, float]]:
+        exclude_ids: Optional[List[int]] = None,
+        exclude_user_id: Optional[str] = None
+    ) -> List[Tuple[PaperRow, float]]:
         """
         使用向量相似度搜索相似论文
         
@@ -81,65 +231,86 @@ class PaperRecommender:
             query_embedding: 查询向量
             limit: 返回数量
             exclude_ids: 要排除的论文 ID 列表
+            exclude_user_id: 排除该用户已读的论文（在数据库内用子查询过滤）
             
         Returns:
             (论文, 相似度分数) 元组列表
         """
-        # 构建 SQL 查询（使用余弦相似度）
-        exclude_clause = ""
-        if exclude_ids:
-            exclude_ids_str = ",".join(map(str, exclude_ids))
-            exclude_clause = f"AND id NOT IN ({exclude_ids_str})"
+        # 查询向量作为 :q 绑定参数由 pgvector 的 psycopg 适配器以二进制发送；
+        # 归一化后内积才等于余弦相似度
+        query_vector = l2_normalize(as_float_array(query_embedding).copy())
+        return self._search_similar(
+            db,
+            "CAST(:q AS halfvec)",
+            {"q": HalfVector(query_vector)},
+            limit,
+            exclude_ids,
+            exclude_user_id
+        )
+    
+    def _search_similar(
+        self,
+        db: Session,
+        query_vector_sql: str,
+        params: dict,
+        limit: int,
+        exclude_ids: Optional[List[int]] = None,
+        exclude_user_id: Optional[str] = None
+    ) -> List[Tuple[PaperRow, float]]:
+        """
+        执行向量近邻检索
         
-        # 将 Python 列表转换为 pgvector 兼容的字符串格式
-        # 确保使用标准小数格式，避免科学计数法
-        vector_str = '[' + ','.join([f'{float(x):.10f}' for x in query_embedding]) + ']'
+        Args:
+            db: 数据库会话
+            query_vector_sql: 查询向量的 SQL 表达式（绑定参数或标量子查询）
+            params: 该表达式用到的绑定参数
+            limit: 返回数量
+            exclude_ids: 要排除的论文 ID 列表
+            exclude_user_id: 排除该用户已读的论文
+            
+        Returns:
+            (论文, 相似度分数) 元组列表
+        """
+        # 构建 SQL 查询（使用余弦相似度），所有值都通过绑定参数传入；
+        # 排除 ID 作为单个 integer[] 参数传入，SQL 文本不随列表长度变化，便于复用执行计划
+        exclude_clause = ""
+        if exclude_user_id is not None:
+            exclude_clause = """
+            AND id NOT IN (
+                SELECT paper_id FROM reading_histories WHERE user_id = :exclude_user_id
+            )"""
         
-        # pgvector 使用 <=> 操作符计算余弦距离（距离越小，相似度越高）
-        # 1 - distance 得到相似度分数
-        # 直接将向量嵌入 SQL 中，避免参数绑定问题
+        # embedding 均为单位向量，余弦相似度 = 内积；pgvector 的 <#> 返回负内积（越小越相似），
+        # 比 <=> 少了每次比较的范数计算，取负得到相似度分数
+        # ORDER BY 保持 "embedding <#> 常量表达式" 的形式，才能命中向量索引
         query = text(f"""
             SELECT 
-                id,
-                title,
-                authors,
-                abstract,
-                pdf_url,
-                arxiv_id,
-                category,
-                published_date,
-                created_at,
-                updated_at,
-                1 - (embedding <=> '{vector_str}'::vector) as similarity
+                {_PAPER_ROW_COLUMNS},
+                -(embedding <#> {query_vector_sql}) as similarity
             FROM papers
             WHERE embedding IS NOT NULL
+            AND {query_vector_sql} IS NOT NULL
+            AND id <> ALL(CAST(:exclude_ids AS integer[]))
             {exclude_clause}
-            ORDER BY embedding <=> '{vector_str}'::vector
+            ORDER BY embedding <#> {query_vector_sql}
             LIMIT :limit
         """)
+        params = {
+            **params,
+            "limit": limit,
+            "exclude_ids": list(exclude_ids or []),
+            "exclude_user_id": exclude_user_id
+        }
         
-        result = db.execute(
-            query,
-            {"limit": limit}
-        )
-        
-        papers_with_scores = []
-        for row in result:
-            paper = Paper(
-                id=row.id,
-                title=row.title,
-                authors=row.authors,
-                abstract=row.abstract,
-                pdf_url=row.pdf_url,
-                arxiv_id=row.arxiv_id,
-                category=row.category,
-                published_date=row.published_date,
-                created_at=row.created_at,
-                updated_at=row.updated_at
-            )
-            papers_with_scores.append((paper, float(row.similarity)))
+        # SET LOCAL 只作用于当前事务，紧随其后的检索语句在同一事务中执行
+        if VECTOR_INDEX_TYPE == "ivfflat":
+            db.execute(text(f"SET LOCAL ivfflat.probes = {int(IVFFLAT_PROBES)}"))
+        else:
+            db.execute(text(f"SET LOCAL hnsw.ef_search = {int(self.ef_search_for(db))}"))
+        result = db.execute(query, params)
         
-        return papers_with_scores
+        # 最后一列是相似度，其余列按顺序构成 PaperRow
+        return [(PaperRow._make(row[:-1]), float(row[-1])) for row in result]
     
     def recommend_by_paper(
         self,
@@ -147,7 +318,7 @@ class PaperRecommender:
         paper_id: int,
         limit: int = 10,
         exclude_current: bool = True
-    ) -> List[Tuple[Paper, float]]:
+    ) -> List[Tuple[PaperRow, float]]:
         """
         基于单篇论文推荐相似论文
         
@@ -160,13 +331,26 @@ class PaperRecommender:
         Returns:
             (论文, 相似度分数) 元组列表
         """
-        # 获取目标论文
-        paper = db.query(Paper).filter(Paper.id == paper_id).first()
-        if not paper or paper.embedding is None:
-            return []
-        
         exclude_ids = [paper_id] if exclude_current else []
-        return self.find_similar_papers(db, paper.embedding, limit, exclude_ids)
+        key = (paper_id, tuple(sorted(exclude_ids)), limit)
+        with _similar_lock:
+            pairs = _similar_cache.get(key)
+        
+        if pairs is None:
+            # 目标论文的 embedding 以标量子查询在数据库内取得，检索只需一次往返；
+            # 论文不存在或没有 embedding 时子查询为 NULL，结果为空
+            pairs = self._search_similar(
+                db,
+                "(SELECT embedding FROM papers WHERE id = :paper_id)",
+                {"paper_id": paper_id},
+                limit,
+                exclude_ids
+            )
+            with _similar_lock:
+                _similar_cache[key] = pairs
+        
+        # PaperRow 不可变、不绑定会话，缓存命中时直接返回，不再查库
+        return list(pairs)
     
     def recommend_by_reading_history(
         self,
@@ -174,13 +358,13 @@ class PaperRecommender:
         user_id: str = "default_user",
         limit: int = 10,
         history_limit: int = 10
-    ) -> List[Tuple[Paper, float]]:
+    ) -> List[Tuple[PaperRow, float]]:
         """
         基于用户阅读历史推荐论文（个性化推荐）
         
         策略：
         1. 获取用户最近阅读的论文
-        2. 计算这些论文 embedding 的平均值
+        2. 在数据库内计算这些论文 embedding 的平均值
         3. 找到与平均 embedding 最相似的论文
         
         Args:
@@ -192,26 +376,22 @@ class PaperRecommender:
         Returns:
             (论文, 相似度分数) 元组列表
         """
-        # 获取用户已读论文 ID
-        read_paper_ids = get_user_read_paper_ids(db, user_id)
-        if not read_paper_ids:
-            return []
-        
-        # 获取最近阅读的论文（有 embedding 的）
-        recent_papers = db.query(Paper).filter(
-            Paper.id.in_(read_paper_ids[:history_limit]),
-            Paper.embedding.isnot(None)
-        ).all()
+        # 最近阅读论文 embedding 的平均值由 pgvector 的 AVG 聚合在数据库内算出并归一化，
+        # 只取回这一个向量，再作为绑定参数执行一次检索
+        read_ids = user_read_paper_ids_subq(user_id, limit=history_limit)
+        avg_embedding = db.scalar(
+            select(func.l2_normalize(func.avg(Paper.embedding))).where(
+                Paper.id.in_(select(read_ids.c.paper_id)),
+                Paper.embedding.isnot(None)
+            )
+        )
         
-        if not recent_papers:
+        # 没有带 embedding 的已读论文
+        if avg_embedding is None:
             return []
         
-        # 计算平均 embedding
-        embeddings = np.array([p.embedding for p in recent_papers])
-        avg_embedding = np.mean(embeddings, axis=0).tolist()
-        
         # 查找相似论文（排除已读）
-        return self.find_similar_papers(db, avg_embedding, limit, read_paper_ids)
+        return self.find_similar_papers(db, avg_embedding, limit, exclude_user_id=user_id)
     
     def recommend_hybrid(
         self,
@@ -219,7 +399,7 @@ class PaperRecommender:
         paper_id: int,
         user_id: str = "default_user",
         limit: int = 10
-    ) -> List[Tuple[Paper, float]]:
+    ) -> List[Tuple[PaperRow, float]]:
         """
         混合推荐：结合当前论文和用户历史
         
@@ -232,32 +412,63 @@ class PaperRecommender:
         Returns:
             (论文, 相似度分数) 元组列表
         """
-        # 获取当前论文
-        current_paper = db.query(Paper).filter(Paper.id == paper_id).first()
-        if not current_paper or current_paper.embedding is None:
+        # 获取当前论文的 embedding（只查这一列；需要在 Python 端与历史向量混合）
+        current_embedding = db.scalar(select(Paper.embedding).where(Paper.id == paper_id))
+        if current_embedding is None:
             return []
         
         # 获取用户已读论文
-        read_paper_ids = get_user_read_paper_ids(db, user_id)
+        read_ids = user_read_paper_ids_subq(user_id, limit=5)
         recent_papers = db.query(Paper).filter(
-            Paper.id.in_(read_paper_ids[:5]),
+            Paper.id.in_(select(read_ids.c.paper_id)),
             Paper.embedding.isnot(None)
-        ).all() if read_paper_ids else []
+        ).all()
         
         # 混合策略：70% 当前论文，30% 用户历史
+        # 两部分先各自归一化再加权，保证权重比例有意义；结果再归一化一次
         if recent_papers:
-            current_embedding = np.array(current_paper.embedding)
-            history_embeddings = np.array([p.embedding for p in recent_papers])
-            avg_history_embedding = np.mean(history_embeddings, axis=0)
+            current_embedding = l2_normalize(as_float_array(current_embedding).copy())
+            history_embeddings = np.asarray(
+                [as_float_array(p.embedding) for p in recent_papers], dtype=np.float32
+            )
+            avg_history_embedding = l2_normalize(history_embeddings.mean(axis=0, dtype=np.float32))
             
-            hybrid_embedding = (0.7 * current_embedding + 0.3 * avg_history_embedding).tolist()
+            hybrid_embedding = current_embedding
+            hybrid_embedding *= 0.7
+            hybrid_embedding += 0.3 * avg_history_embedding
+            l2_normalize(hybrid_embedding)
         else:
-            hybrid_embedding = current_paper.embedding
+            hybrid_embedding = current_embedding
         
         # 排除当前论文和已读论文
-        exclude_ids = [paper_id] + read_paper_ids
-        return self.find_similar_papers(db, hybrid_embedding, limit, exclude_ids)
+        return self.find_similar_papers(db, hybrid_embedding, limit, [paper_id], exclude_user_id=user_id)
+
+
+def build_recommender() -> PaperRecommender:
+    """创建推荐引擎实例（由调用方负责复用，如 Streamlit 的 st.cache_resource）"""
+    return PaperRecommender()
+
+
+# ==================== 相似推荐缓存失效 ====================
+
+def invalidate_similar_cache():
+    """清空相似推荐缓存（新论文或 embedding 变化会改变已有论文的近邻）"""
+    with _similar_lock:
+        _similar_cache.clear()
+
+
+@event.listens_for(Paper, "after_insert")
+@event.listens_for(Paper, "after_update")
+@event.listens_for(Paper, "after_delete")
+def _on_paper_flush(mapper, connection, target):
+    invalidate_similar_cache()
 
 
-# 全局单例
-recommender = PaperRecommender()
+@event.listens_for(Session, "do_orm_execute")
+def _on_paper_bulk_statement(orm_execute_state):
+    # 批量 INSERT / UPDATE / DELETE 语句（create_papers、update_paper_embeddings 等）不经过 mapper 事件
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and table.name == Paper.__tablename__:
+        invalidate_similar_cache()
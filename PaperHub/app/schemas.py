@@ -1,7 +1,7 @@
 """
 Pydantic schemas for request/response validation
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 from typing import List, Optional
 from datetime import datetime
 
@@ -22,14 +22,13 @@ class TagResponse(TagBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaperBase(BaseModel):
     """论文基础模型"""
     title: str = Field(..., min_length=1, max_length=500)
-    authors: List[str] = Field(..., min_items=1)
+    authors: List[str] = Field(..., min_length=1)
     abstract: Optional[str] = None
     pdf_url: Optional[str] = None
     arxiv_id: Optional[str] = Field(None, max_length=50)
@@ -60,8 +59,7 @@ class PaperResponse(PaperBase):
     updated_at: datetime
     tags: List[TagResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaperWithSimilarity(PaperResponse):
@@ -88,8 +86,7 @@ class ReadingHistoryResponse(ReadingHistoryBase):
     read_at: datetime
     paper: Optional[PaperResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaperSearchRequest(BaseModel):
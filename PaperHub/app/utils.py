@@ -4,8 +4,31 @@
 import arxiv
 from typing import List, Dict, Optional
 from datetime import datetime
-import time
 import re
+import pandas as pd
+
+
+# 正则在模块加载时编译一次，导入大批摘要时避免每次调用都查 re 的模式缓存
+_WHITESPACE = re.compile(r'\s+')
+
+# arXiv ID 提取 (YYMM.NNNNN 或 arch-ive/YYMMNNN)，按顺序尝试
+_ARXIV_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'arxiv\.org/abs/(\d{4}\.\d{4,5})',
+        r'arxiv:(\d{4}\.\d{4,5})',
+        r'^(\d{4}\.\d{4,5})$',
+        r'arxiv\.org/abs/([a-z\-]+/\d{7})',
+    )
+]
+
+# 共享的 arXiv API 客户端：按页批量拉取（单页最多 100 条），两次请求间隔 3 秒（arXiv API 的限速要求），
+# 失败自动重试；模块级共享以便跨调用遵守请求间隔
+_ARXIV_CLIENT = arxiv.Client(page_size=100, delay_seconds=3, num_retries=3)
+
+# arXiv ID 校验：新格式 YYMM.NNNNN / 旧格式 arch-ive/YYMMNNN
+_ARXIV_NEW = re.compile(r'^\d{4}\.\d{4,5}$')
+_ARXIV_OLD = re.compile(r'^[a-z\-]+/\d{7}$')
 
 
 def clean_text(text: str) -> str:
@@ -22,7 +45,7 @@ def clean_text(text: str) -> str:
         return ""
     
     # 替换多个空白字符为单个空格
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE.sub(' ', text)
     # 去除首尾空白
     text = text.strip()
     return text
@@ -47,21 +70,27 @@ def extract_arxiv_id(url_or_id: str) -> Optional[str]:
         return None
     
     # 匹配 arXiv ID 格式 (YYMM.NNNNN 或 arch-ive/YYMMNNN)
-    patterns = [
-        r'arxiv\.org/abs/(\d{4}\.\d{4,5})',
-        r'arxiv:(\d{4}\.\d{4,5})',
-        r'^(\d{4}\.\d{4,5})$',
-        r'arxiv\.org/abs/([a-z\-]+/\d{7})',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url_or_id, re.IGNORECASE)
+    for pattern in _ARXIV_PATTERNS:
+        match = pattern.search(url_or_id)
         if match:
             return match.group(1)
     
     return None
 
 
+def _result_to_dict(result: arxiv.Result) -> Dict:
+    """arXiv 结果转为论文信息字典（只保留入库和页面展示用到的字段）"""
+    return {
+        'title': clean_text(result.title),
+        'authors': [author.name for author in result.authors],
+        'abstract': clean_text(result.summary),
+        'pdf_url': result.pdf_url,
+        'arxiv_id': result.entry_id.split('/abs/')[-1],
+        'category': result.primary_category,
+        'published_date': result.published,
+    }
+
+
 def search_arxiv_papers(
     query: str,
     max_results: int = 10,
@@ -87,25 +116,7 @@ def search_arxiv_papers(
         sort_order=sort_order
     )
     
-    papers = []
-    for result in search.results():
-        paper = {
-            'title': clean_text(result.title),
-            'authors': [author.name for author in result.authors],
-            'abstract': clean_text(result.summary),
-            'pdf_url': result.pdf_url,
-            'arxiv_id': result.entry_id.split('/abs/')[-1],
-            'category': result.primary_category,
-            'published_date': result.published,
-            'updated_date': result.updated,
-            'categories': result.categories,
-            'comment': result.comment,
-            'journal_ref': result.journal_ref,
-        }
-        papers.append(paper)
-        time.sleep(0.5)  # 避免请求过快
-    
-    return papers
+    return [_result_to_dict(result) for result in _ARXIV_CLIENT.results(search)]
 
 
 def fetch_arxiv_by_id(arxiv_id: str) -> Optional[Dict]:
@@ -119,23 +130,8 @@ def fetch_arxiv_by_id(arxiv_id: str) -> Optional[Dict]:
         论文信息字典或 None
     """
     search = arxiv.Search(id_list=[arxiv_id])
-    
-    try:
-        result = next(search.results())
-        paper = {
-            'title': clean_text(result.title),
-            'authors': [author.name for author in result.authors],
-            'abstract': clean_text(result.summary),
-            'pdf_url': result.pdf_url,
-            'arxiv_id': result.entry_id.split('/abs/')[-1],
-            'category': result.primary_category,
-            'published_date': result.published,
-            'updated_date': result.updated,
-            'categories': result.categories,
-        }
-        return paper
-    except StopIteration:
-        return None
+    result = next(_ARXIV_CLIENT.results(search), None)
+    return _result_to_dict(result) if result is not None else None
 
 
 def search_arxiv_by_category(
@@ -217,6 +213,42 @@ def truncate_text(text: str, max_length: int = 200, suffix: str = "...") -> str:
     return text[:max_length - len(suffix)] + suffix
 
 
+def format_authors_series(authors: pd.Series, max_display: int = 3) -> pd.Series:
+    """
+    format_authors 的向量化版本：整列作者列表一次格式化
+    
+    Args:
+        authors: 每个元素为作者列表的 Series
+        max_display: 最多显示的作者数
+        
+    Returns:
+        格式化的作者字符串 Series
+    """
+    counts = authors.str.len().fillna(0)
+    formatted = authors.str[:max_display].str.join(", ")
+    formatted = formatted.where(counts <= max_display, formatted + ", et al.")
+    return formatted.where(counts > 0, "Unknown")
+
+
+def truncate_text_series(texts: pd.Series, max_length: int = 200, suffix: str = "...") -> pd.Series:
+    """
+    truncate_text 的向量化版本（空值转为空字符串）
+    
+    Args:
+        texts: 文本 Series
+        max_length: 最大长度
+        suffix: 截断后缀
+        
+    Returns:
+        截断后的文本 Series
+    """
+    texts = texts.fillna("")
+    return texts.where(
+        texts.str.len() <= max_length,
+        texts.str.slice(0, max_length - len(suffix)) + suffix
+    )
+
+
 def get_arxiv_categories() -> Dict[str, str]:
     """
     获取常见的 arXiv 分类及其描述
@@ -272,11 +304,11 @@ def validate_arxiv_id(arxiv_id: str) -> bool:
         return False
     
     # 新格式: YYMM.NNNNN
-    if re.match(r'^\d{4}\.\d{4,5}$', arxiv_id):
+    if _ARXIV_NEW.match(arxiv_id):
         return True
     
     # 旧格式: arch-ive/YYMMNNN
-    if re.match(r'^[a-z\-]+/\d{7}$', arxiv_id):
+    if _ARXIV_OLD.match(arxiv_id):
         return True
     
     return False
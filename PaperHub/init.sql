@@ -1,2 +1,4 @@
 -- Initialize pgvector extension
 CREATE EXTENSION IF NOT EXISTS vector;
+-- Trigram matching for substring (ILIKE) search indexes
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
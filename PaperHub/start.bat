@@ -17,7 +17,7 @@ timeout /t 15 /nobreak
 
 echo.
 echo [4/4] Initialize database tables...
-python -m app.database
+alembic upgrade head
 
 echo.
 echo ========================================